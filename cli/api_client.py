@@ -1,15 +1,20 @@
 """API 客户端封装"""
 
-import json
 from typing import AsyncIterator
 from dataclasses import dataclass
 
 import httpx
+import orjson
 
-from .config import DEFAULT_BASE_URL, DEFAULT_TIMEOUT
+from .config import DEFAULT_BASE_URL, DEFAULT_TIMEOUT, SSE_MAX_EVENT_BYTES
 
+# 终结事件：收到即停止消费（服务端随后关闭连接）。
+# 本地副本，与 core.events.TERMINAL_EVENT_TYPES 的一致性由
+# tests/core/test_terminal_event_sync.py 守护
+_TERMINAL_EVENTS = frozenset({"complete", "cancelled", "timed_out", "error"})
 
-@dataclass
+
+@dataclass(slots=True)
 class SendMessageResponse:
     """发送消息响应"""
     conversation_id: str
@@ -17,12 +22,107 @@ class SendMessageResponse:
     stream_url: str
 
 
-@dataclass
 class SSEEvent:
-    """SSE 事件"""
-    type: str
-    data: dict
-    agent: str | None = None
+    """
+    SSE 事件（每个流式 token 一个实例，__slots__ 省掉逐实例 __dict__）
+
+    data / agent 惰性解码：从流里构造时只持有原始 JSON 负载，首次访问 data 或
+    agent 才 orjson 解码并缓存。只看 type 的事件（如 agent_complete）全程不解码。
+    负载损坏时按空事件处理（与旧的解码失败即跳过一致，不让显示层崩）。
+    """
+
+    __slots__ = ("type", "_payload", "_envelope")
+
+    def __init__(self, type: str, data: dict | None = None, agent: str | None = None):
+        self.type = type
+        self._payload: bytes | memoryview | None = None
+        self._envelope: dict | None = {"data": {} if data is None else data, "agent": agent}
+
+    @classmethod
+    def from_payload(cls, type: str, payload: bytes | memoryview) -> "SSEEvent":
+        """由未解码的 SSE data 负载构造（惰性解码）"""
+        event = cls.__new__(cls)
+        event.type = type
+        event._payload = payload
+        event._envelope = None
+        return event
+
+    def _decoded(self) -> dict:
+        envelope = self._envelope
+        if envelope is None:
+            try:
+                envelope = orjson.loads(self._payload)
+            except orjson.JSONDecodeError:
+                envelope = {}
+            self._envelope = envelope
+            self._payload = None
+        return envelope
+
+    @property
+    def data(self) -> dict:
+        return self._decoded().get("data", {})
+
+    @property
+    def agent(self) -> str | None:
+        return self._decoded().get("agent")
+
+    def __repr__(self) -> str:
+        return f"SSEEvent(type={self.type!r}, data={self.data!r}, agent={self.agent!r})"
+
+
+async def _iter_sse_events(response: httpx.Response) -> AsyncIterator[tuple[str | None, bytes | memoryview]]:
+    """
+    字节级 SSE 解帧器：逐事件 yield (event 名, data 负载)。
+
+    按 SSE 规范组帧——空行派发事件；多行 data: 以 \n 拼接；event: 只作用于
+    当前事件；id:/retry: 与 ": ping" 心跳注释忽略；行尾兼容 \r\n。
+
+    替代 aiter_lines()——后者逐行 decode 成 str 并做通用换行切分，在逐 token
+    推送的流上是热点。行是网络块上的 memoryview 切片（零拷贝），负载直接交给
+    orjson；只有跨块的半行尾巴会被拷贝一次。不给 aiter_bytes 传 chunk_size：
+    那会攒满整块才吐，破坏流式实时性。
+
+    背压：这是拉取式生成器，消费方不取下一个事件时不会再读 socket，TCP 窗口把
+    压力传回服务端。下游 StreamDisplay 的渲染队列有界（RENDER_QUEUE_MAXSIZE），
+    终端卡住时入队阻塞，从而停止拉取。本函数内唯一可能无界增长的是未闭合的
+    事件缓冲（半行 + 累积的 data 行），超过 SSE_MAX_EVENT_BYTES 直接报错。
+    """
+    pending = b""
+    event_name: str | None = None
+    data_lines: list[memoryview] = []
+    data_size = 0
+    async for chunk in response.aiter_bytes():
+        data = pending + chunk if pending else chunk
+        view = memoryview(data)
+        start = 0
+        while (idx := data.find(b"\n", start)) != -1:
+            end = idx - 1 if idx > start and data[idx - 1] == 0x0D else idx  # 去掉 \r
+            line = view[start:end]
+            start = idx + 1
+
+            # 热路径：data 行只做一次切片比较
+            if line[:5] == b"data:":
+                data_lines.append(line[5:])
+                data_size += len(line)
+                if data_size > SSE_MAX_EVENT_BYTES:
+                    raise ValueError(f"SSE event exceeds {SSE_MAX_EVENT_BYTES} bytes")
+                continue
+            if line:
+                # ": ping" 心跳注释按首字节直接丢弃；其余非 data 字段只认 event:
+                if line[0] != 0x3A and line[:6] == b"event:":
+                    event_name = bytes(line[6:]).strip().decode()
+                continue
+
+            # 空行：派发当前事件（只有 event:/注释、没有 data 的块按规范丢弃）
+            if data_lines:
+                payload = data_lines[0] if len(data_lines) == 1 else b"\n".join(data_lines)
+                yield event_name, payload
+                data_lines = []
+                data_size = 0
+            event_name = None
+        pending = data[start:]
+        if len(pending) > SSE_MAX_EVENT_BYTES:
+            raise ValueError(f"SSE line exceeds {SSE_MAX_EVENT_BYTES} bytes")
 
 
 class APIClient:
@@ -37,6 +137,47 @@ class APIClient:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.token = token
+        # 共享 AsyncClient：连接池在多次请求间复用 TCP/TLS 连接（health → chat → stream
+        # → resume 不再每次重新握手），DNS 也只在新建连接时解析一次。懒创建——连接池
+        # 绑定到首次使用时的事件循环，aclose() 后置空，下一次调用在新循环里重建。
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """返回共享的 httpx.AsyncClient（懒创建）"""
+        if self._client is None:
+            # 连接池参数落在显式 transport 上（传入 transport 后 client 级的
+            # http2/limits 不再生效）。
+            # http2=True：https 反代经 ALPN 协商到 h2 时，SSE 长流与 resume/chat 短请求
+            # 多路复用同一连接；明文 http（本地 uvicorn）自动回落 HTTP/1.1。
+            # retries=1：只重试建连失败（ConnectError/ConnectTimeout），不重放已发出的请求。
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=1,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60,
+                ),
+            )
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                transport=transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """关闭共享连接池"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "APIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     def _auth_headers(self) -> dict:
         """返回认证 header"""
@@ -46,22 +187,21 @@ class APIClient:
 
     async def health_check(self) -> bool:
         """健康检查"""
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=10) as client:
-            try:
-                resp = await client.get("/health/ready")
-                return resp.status_code == 200
-            except Exception:
-                return False
+        try:
+            resp = await self.client.get("/health/ready", timeout=10)
+            return resp.status_code == 200
+        except Exception:
+            return False
 
     async def login(self, username: str, password: str) -> dict:
         """登录获取 token"""
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=10) as client:
-            resp = await client.post(
-                "/api/v1/auth/login",
-                json={"username": username, "password": password},
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self.client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": password},
+            timeout=10,
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     async def send_message(
         self,
@@ -70,59 +210,73 @@ class APIClient:
         parent_message_id: str | None = None,
     ) -> SendMessageResponse:
         """发送消息"""
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout) as client:
-            payload = {"user_input": content}
-            if conversation_id:
-                payload["conversation_id"] = conversation_id
-            if parent_message_id:
-                payload["parent_message_id"] = parent_message_id
-
-            # /chat is multipart: the ChatRequest JSON goes in a `payload` form
-            # field; (None, value) sends it as a form field (no attachments).
-            resp = await client.post(
-                "/api/v1/chat",
-                files={"payload": (None, json.dumps(payload))},
-                headers=self._auth_headers(),
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        payload = {"user_input": content}
+        if conversation_id:
+            payload["conversation_id"] = conversation_id
+        if parent_message_id:
+            payload["parent_message_id"] = parent_message_id
 
-            return SendMessageResponse(
-                conversation_id=data["conversation_id"],
-                message_id=data["message_id"],
-                stream_url=data["stream_url"],
-            )
+        # /chat is multipart: the ChatRequest JSON goes in a `payload` form
+        # field; (None, value) sends it as a form field (no attachments).
+        resp = await self.client.post(
+            "/api/v1/chat",
+            files={"payload": (None, orjson.dumps(payload))},
+            headers=self._auth_headers(),
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
-    async def stream_response(self, stream_url: str) -> AsyncIterator[SSEEvent]:
-        """流式接收响应"""
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout) as client:
-            async with client.stream("GET", stream_url, headers=self._auth_headers()) as response:
-                current_event_name: str | None = None
-                async for line in response.aiter_lines():
-                    if line.startswith("event:"):
-                        current_event_name = line[6:].strip()
-                        continue
+        return SendMessageResponse(
+            conversation_id=data["conversation_id"],
+            message_id=data["message_id"],
+            stream_url=data["stream_url"],
+        )
 
-                    if not line.startswith("data:"):
-                        continue
+    async def stream_response(
+        self,
+        stream_url: str,
+        wanted: frozenset[str] | None = None,
+    ) -> AsyncIterator[SSEEvent]:
+        """
+        流式接收响应
+
+        Args:
+            stream_url: SSE 流地址
+            wanted: 调用方会消费的事件类型；None 表示全部。不在集合里的事件按 SSE
+                event: 名直接跳过，不做 JSON 解码也不构造 SSEEvent（artifact_* 事件
+                携带整篇正文，解码开销不小）。终结事件总是送达。
+        """
+        async with self.client.stream("GET", stream_url, headers=self._auth_headers()) as response:
+            async for event_name, payload in _iter_sse_events(response):
+                if (
+                    wanted is not None
+                    and event_name is not None
+                    and event_name not in wanted
+                    and event_name not in _TERMINAL_EVENTS
+                ):
+                    continue
 
+                if event_name is not None:
+                    # 有 SSE event: 名（服务端总会带）：不解码，交给 SSEEvent 惰性处理
+                    yield SSEEvent.from_payload(event_name, payload)
+                    event_type = event_name
+                else:
+                    # 无 event: 名只能解码负载回退到 data.type
                     try:
-                        event_data = json.loads(line[5:].strip())
-                        # 优先使用 SSE event: 字段，回退到 data.type
-                        event_type = current_event_name or event_data.get("type", "unknown")
-                        current_event_name = None
-
-                        yield SSEEvent(
-                            type=event_type,
-                            data=event_data.get("data", {}),
-                            agent=event_data.get("agent"),
-                        )
-
-                        # 终结事件
-                        if event_type in ("complete", "error", "cancelled"):
-                            break
-                    except json.JSONDecodeError:
+                        # orjson 直接吃 bytes 且容忍首尾空白：不 decode、不 strip
+                        event_data = orjson.loads(payload)
+                    except orjson.JSONDecodeError:
                         continue
+                    event_type = event_data.get("type", "unknown")
+                    yield SSEEvent(
+                        type=event_type,
+                        data=event_data.get("data", {}),
+                        agent=event_data.get("agent"),
+                    )
+
+                # 终结事件
+                if event_type in _TERMINAL_EVENTS:
+                    break
 
     async def resume_execution(
         self,
@@ -131,56 +285,55 @@ class APIClient:
         approved: bool,
     ) -> None:
         """恢复中断的执行（权限确认后）。引擎原地继续，事件走同一 SSE 连接。"""
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout) as client:
-            resp = await client.post(
-                f"/api/v1/chat/{conversation_id}/resume",
-                json={
-                    "message_id": message_id,
-                    "approved": approved,
-                },
-                headers=self._auth_headers(),
-            )
-            resp.raise_for_status()
+        resp = await self.client.post(
+            f"/api/v1/chat/{conversation_id}/resume",
+            json={
+                "message_id": message_id,
+                "approved": approved,
+            },
+            headers=self._auth_headers(),
+        )
+        resp.raise_for_status()
 
     async def list_conversations(self, limit: int = 20, offset: int = 0) -> dict:
         """列出对话"""
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=10) as client:
-            resp = await client.get(
-                "/api/v1/chat",
-                params={"limit": limit, "offset": offset},
-                headers=self._auth_headers(),
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self.client.get(
+            "/api/v1/chat",
+            params={"limit": limit, "offset": offset},
+            headers=self._auth_headers(),
+            timeout=10,
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     async def get_conversation(self, conversation_id: str) -> dict:
         """获取对话详情"""
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=10) as client:
-            resp = await client.get(
-                f"/api/v1/chat/{conversation_id}",
-                headers=self._auth_headers(),
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self.client.get(
+            f"/api/v1/chat/{conversation_id}",
+            headers=self._auth_headers(),
+            timeout=10,
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     async def list_artifacts(self, session_id: str) -> dict:
         """列出 Artifacts"""
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=10) as client:
-            resp = await client.get(
-                f"/api/v1/artifacts/{session_id}",
-                headers=self._auth_headers(),
-            )
-            if resp.status_code == 404:
-                return {"session_id": session_id, "artifacts": []}
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self.client.get(
+            f"/api/v1/artifacts/{session_id}",
+            headers=self._auth_headers(),
+            timeout=10,
+        )
+        if resp.status_code == 404:
+            return {"session_id": session_id, "artifacts": []}
+        resp.raise_for_status()
+        return resp.json()
 
     async def get_artifact(self, session_id: str, artifact_id: str) -> dict:
         """获取单个 Artifact"""
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=10) as client:
-            resp = await client.get(
-                f"/api/v1/artifacts/{session_id}/{artifact_id}",
-                headers=self._auth_headers(),
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self.client.get(
+            f"/api/v1/artifacts/{session_id}/{artifact_id}",
+            headers=self._auth_headers(),
+            timeout=10,
+        )
+        resp.raise_for_status()
+        return resp.json()
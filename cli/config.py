@@ -1,11 +1,16 @@
 """CLI 配置"""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import orjson
+
 # 默认配置
 DEFAULT_BASE_URL = "http://localhost:8000"
 DEFAULT_TIMEOUT = 120  # SSE 需要较长时间
+# 单个 SSE 事件（含跨网络块拼接中的半行）的字节上限。artifact_* 事件携带整篇正文，
+# 上限给得宽；只防失控/异常的服务端让解帧缓冲无限增长
+SSE_MAX_EVENT_BYTES = 64 * 1024 * 1024
 
 # 状态文件（保存当前会话，存储在项目目录下）
 STATE_FILE = Path(__file__).parent.parent / ".cli_state"
@@ -19,25 +24,31 @@ class CLIState:
     parent_message_id: str | None = None
     token: str | None = None
 
+    # 最近一次落盘（或从盘加载）的序列化内容；内容未变时 save() 跳过写文件
+    _persisted: bytes | None = field(default=None, init=False, repr=False, compare=False)
+
     def save(self):
-        """保存状态到文件"""
-        import json
-        data = {
+        """保存状态到文件（内容未变化时不重复写）"""
+        payload = orjson.dumps({
             "conversation_id": self.conversation_id,
             "session_id": self.session_id,
             "parent_message_id": self.parent_message_id,
             "token": self.token,
-        }
-        STATE_FILE.write_text(json.dumps(data))
+        })
+        if payload == self._persisted:
+            return
+        STATE_FILE.write_bytes(payload)
+        self._persisted = payload
 
     @classmethod
     def load(cls) -> "CLIState":
         """从文件加载状态"""
-        import json
         if STATE_FILE.exists():
             try:
-                data = json.loads(STATE_FILE.read_text())
-                return cls(**data)
+                raw = STATE_FILE.read_bytes()
+                state = cls(**orjson.loads(raw))
+                state._persisted = raw
+                return state
             except Exception:
                 pass
         return cls()
@@ -57,3 +68,4 @@ class CLIState:
         self.token = None
         if STATE_FILE.exists():
             STATE_FILE.unlink()
+        self._persisted = None
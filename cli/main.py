@@ -1,8 +1,11 @@
 """ArtifactFlow CLI 主入口"""
 
 import asyncio
-from typing import Optional
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
 
+import httpx
 import typer
 from rich.prompt import Prompt
 
@@ -29,6 +32,28 @@ def get_client(base_url: str = DEFAULT_BASE_URL) -> APIClient:
     return client
 
 
+@contextmanager
+def cli_session(api: APIClient) -> Iterator[asyncio.Runner]:
+    """
+    一条 CLI 命令共享一个事件循环：所有请求复用同一连接池，退出时关闭。
+
+    用 asyncio.Runner 而非多次 asyncio.run——连接池绑定到创建它的事件循环，
+    跨循环不可复用。Runner.run 逐次调用仍保留 Ctrl+C 语义：SIGINT 只取消
+    当前这次 run 的任务并抛 KeyboardInterrupt，循环本身存活，交互模式可继续。
+    """
+    with asyncio.Runner() as runner:
+        try:
+            yield runner
+        finally:
+            runner.run(api.aclose())
+
+
+def run_async(api: APIClient, coro):
+    """单次调用的命令：在独立会话中运行协程"""
+    with cli_session(api) as runner:
+        return runner.run(coro)
+
+
 # ============================================================
 # 认证命令
 # ============================================================
@@ -47,7 +72,7 @@ def login(
     api = APIClient(base_url=base_url)
 
     try:
-        result = asyncio.run(api.login(username, password))
+        result = run_async(api, api.login(username, password))
         state.token = result["access_token"]
         state.save()
 
@@ -86,27 +111,123 @@ def chat(
     """
     api = get_client(base_url)
 
-    # 检查服务器
-    if not asyncio.run(api.health_check()):
-        ui.print_error(f"Cannot connect to server at {base_url}")
-        ui.print_info("Make sure the server is running: python run_server.py")
-        raise typer.Exit(1)
+    # 健康检查 + 所有轮次共用一个事件循环和连接池
+    with cli_session(api) as runner:
+        # 交互模式先确认服务可达再进 REPL；单条消息不做串行健康检查，
+        # 首个 POST 的连接错误即不可达信号（见 _send_message_async），省一个 RTT
+        if message is None and not runner.run(api.health_check()):
+            _print_unreachable(base_url)
+            raise typer.Exit(1)
+
+        # 新对话
+        if new:
+            state.clear()
+            ui.print_info("Starting new conversation")
+
+        # 交互模式
+        if message is None:
+            interactive_chat(api, runner)
+        else:
+            send_single_message(api, message, runner)
 
-    # 新对话
-    if new:
-        state.clear()
-        ui.print_info("Starting new conversation")
 
-    # 交互模式
-    if message is None:
-        interactive_chat(api)
-    else:
-        send_single_message(api, message)
+def _print_unreachable(base_url: str):
+    """打印服务不可达提示"""
+    ui.print_error(f"Cannot connect to server at {base_url}")
+    ui.print_info("Make sure the server is running: python run_server.py")
 
 
-def send_single_message(api: APIClient, message: str):
+def send_single_message(api: APIClient, message: str, runner: asyncio.Runner):
     """发送单条消息"""
-    asyncio.run(_send_message_async(api, message))
+    runner.run(_send_message_async(api, message))
+
+
+@dataclass(slots=True)
+class StreamResult:
+    """一次 SSE 流消费的结果"""
+    success: bool = False
+    cancelled: bool = False
+    message_id: str | None = None
+
+
+@dataclass(slots=True)
+class _StreamContext:
+    """_stream_events 的处理器上下文（事件处理器共享的可变状态）"""
+    api: APIClient
+    display: ui.StreamDisplay
+    conversation_id: str
+    message_id: str
+    result: StreamResult
+
+
+async def _on_metadata(ctx: _StreamContext, data: dict):
+    if "message_id" in data:
+        ctx.result.message_id = data["message_id"]
+
+
+async def _on_permission_request(ctx: _StreamContext, data: dict):
+    # 暂停 Live 显示，在流内直接处理权限确认
+    ctx.display.stop()
+
+    tool_name = data.get("tool", "unknown")
+    level = data.get("permission_level", "unknown")
+    params = data.get("params", {})
+
+    ui.print_permission_request(tool_name, level, params)
+
+    # 在线程中执行阻塞式用户输入，避免阻塞事件循环
+    answer = await asyncio.to_thread(
+        Prompt.ask,
+        "[yellow]Approve?[/yellow]",
+        choices=["y", "n"],
+        default="y",
+    )
+    approved = answer.lower() == "y"
+
+    # 解决中断，引擎继续执行，事件继续通过同一 SSE 连接推送
+    msg_id = ctx.result.message_id or ctx.message_id
+    await ctx.api.resume_execution(ctx.conversation_id, msg_id, approved)
+
+    # 恢复 Live 显示，继续消费后续 SSE 事件
+    ctx.display.start()
+
+
+async def _on_complete(ctx: _StreamContext, data: dict):
+    ctx.result.success = data.get("success", False)
+    if "message_id" in data:
+        ctx.result.message_id = data["message_id"]
+
+
+async def _on_cancelled(ctx: _StreamContext, data: dict):
+    ctx.result.success = False
+    ctx.result.cancelled = True
+    if "message_id" in data:
+        ctx.result.message_id = data["message_id"]
+    ctx.display.stop()
+    ui.print_info("Execution cancelled")
+    ctx.display.start()
+
+
+async def _on_error(ctx: _StreamContext, data: dict):
+    ctx.result.success = False
+    # 渲染线程可能还有积压，先让它们落到终端，错误信息排在最后
+    ctx.display.flush()
+    ui.print_error(data.get("error", "Unknown error"))
+
+
+# 事件类型 → 处理器。绝大多数事件（llm_chunk 等）只需渲染，查表落空即跳过，
+# 逐 token 热路径上只剩一次 dict 查找，不再走 if/elif 比较链。
+_EVENT_HANDLERS = {
+    "metadata": _on_metadata,
+    "permission_request": _on_permission_request,
+    "complete": _on_complete,
+    "cancelled": _on_cancelled,
+    "error": _on_error,
+}
+
+# 显示层或上面的处理器会消费的事件类型，其余（artifact_*、execution_queued、
+# user_input 等）在 api_client 里按 event: 名直接跳过，不解码不构造
+_WANTED_EVENTS = frozenset(_EVENT_HANDLERS) | ui.StreamDisplay.HANDLED_EVENT_TYPES
 
 
 async def _stream_events(
@@ -115,69 +236,28 @@ async def _stream_events(
     stream_url: str,
     conversation_id: str,
     message_id: str,
-) -> dict:
+) -> StreamResult:
     """
     消费 SSE 事件流，返回结果信息。
     权限中断在流内直接处理（保持 SSE 连接不断开）。
 
     Returns:
-        dict with keys:
-        - success: bool
-        - cancelled: bool
-        - message_id: str | None
+        StreamResult（success / cancelled / message_id）
     """
-    result = {"success": False, "cancelled": False, "message_id": None}
-
-    async for event in api.stream_response(stream_url):
-        display.handle_event(event)
-
-        if event.type == "metadata":
-            if "message_id" in event.data:
-                result["message_id"] = event.data["message_id"]
+    result = StreamResult()
+    ctx = _StreamContext(api, display, conversation_id, message_id, result)
+    handlers = _EVENT_HANDLERS
 
-        elif event.type == "permission_request":
-            # 暂停 Live 显示，在流内直接处理权限确认
-            display.stop()
+    async for event in api.stream_response(stream_url, wanted=_WANTED_EVENTS):
+        handler = handlers.get(event.type)
+        # 需要处理器的事件在入队前解码：SSEEvent 惰性解码不是线程安全的，
+        # 不能和渲染线程同时首次访问 data
+        data = event.data if handler is not None else None
 
-            tool_name = event.data.get("tool", "unknown")
-            level = event.data.get("permission_level", "unknown")
-            params = event.data.get("params", {})
-
-            ui.print_permission_request(tool_name, level, params)
-
-            # 在线程中执行阻塞式用户输入，避免阻塞事件循环
-            answer = await asyncio.to_thread(
-                Prompt.ask,
-                "[yellow]Approve?[/yellow]",
-                choices=["y", "n"],
-                default="y",
-            )
-            approved = answer.lower() == "y"
-
-            # 解决中断，引擎继续执行，事件继续通过同一 SSE 连接推送
-            msg_id = result.get("message_id") or message_id
-            await api.resume_execution(conversation_id, msg_id, approved)
-
-            # 恢复 Live 显示，继续消费后续 SSE 事件
-            display.start()
-
-        elif event.type == "complete":
-            result["success"] = event.data.get("success", False)
-            if "message_id" in event.data:
-                result["message_id"] = event.data["message_id"]
-
-        elif event.type == "cancelled":
-            result["success"] = False
-            result["cancelled"] = True
-            if "message_id" in event.data:
-                result["message_id"] = event.data["message_id"]
-            display.stop()
-            ui.print_info("Execution cancelled")
-            display.start()
+        display.handle_event(event)
 
-        elif event.type == "error":
-            result["success"] = False
-            ui.print_error(event.data.get("error", "Unknown error"))
+        if handler is not None:
+            await handler(ctx, data)
 
     return result
 
@@ -211,32 +291,45 @@ async def _send_message_async(api: APIClient, message: str):
                 resp.conversation_id, resp.message_id,
             )
         finally:
-            display.stop()
+            render_error = display.stop()
+        # 渲染线程的错误只在流本身正常结束时抛出，不盖掉正在传播的网络 / 取消异常
+        if render_error is not None:
+            raise render_error
 
         # 更新 message_id
-        if result.get("message_id"):
-            state.parent_message_id = result["message_id"]
+        if result.message_id:
+            state.parent_message_id = result.message_id
 
         # 取消是用户主动行为，不再叠加 "Execution failed" 误导提示。
-        if not result["success"] and not result.get("cancelled"):
+        if not result.success and not result.cancelled:
             ui.print_error("Execution failed")
 
         # 保存状态
         state.save()
 
+    except httpx.ConnectError:
+        _print_unreachable(api.base_url)
+        raise typer.Exit(1)
     except Exception as e:
         ui.print_error(f"Failed to send message: {e}")
         raise typer.Exit(1)
 
 
-def interactive_chat(api: APIClient):
+def interactive_chat(api: APIClient, runner: asyncio.Runner):
     """交互式聊天模式"""
     ui.console.print("[cyan]Interactive mode. Type 'quit' or 'exit' to leave.[/cyan]")
     ui.console.print("[dim]Commands: /new (new conversation), /status (show state)[/dim]\n")
 
+    try:
+        import readline  # noqa: F401  — 为 input() 启用行编辑 / 历史（Windows 无此模块）
+    except ImportError:
+        pass
+
     while True:
         try:
-            message = Prompt.ask("[green]You[/green]")
+            # console.input 直接调 input()：不像 Prompt.ask 每轮构造 Prompt 实例、
+            # 跑 choices/校验流程；readline 已加载时自带行编辑与历史
+            message = ui.console.input("[green]You[/green]: ")
 
             if not message.strip():
                 continue
@@ -255,7 +348,7 @@ def interactive_chat(api: APIClient):
                 continue
 
             # 发送消息
-            asyncio.run(_send_message_async(api, message))
+            runner.run(_send_message_async(api, message))
             ui.console.print()  # 空行分隔
 
         except KeyboardInterrupt:
@@ -278,7 +371,7 @@ def list_conversations(
     api = get_client(base_url)
 
     try:
-        result = asyncio.run(api.list_conversations(limit=limit))
+        result = run_async(api, api.list_conversations(limit=limit))
         conversations = result.get("conversations", [])
 
         if not conversations:
@@ -302,7 +395,7 @@ def show_conversation(
     api = get_client(base_url)
 
     try:
-        conv = asyncio.run(api.get_conversation(conversation_id))
+        conv = run_async(api, api.get_conversation(conversation_id))
         ui.print_conversation_detail(conv)
 
     except Exception as e:
@@ -320,7 +413,7 @@ def use_conversation(
 
     try:
         # 验证对话存在
-        conv = asyncio.run(api.get_conversation(conversation_id))
+        conv = run_async(api, api.get_conversation(conversation_id))
 
         # 更新状态
         state.conversation_id = conv["id"]
@@ -361,7 +454,7 @@ def list_artifacts(
         raise typer.Exit(1)
 
     try:
-        result = asyncio.run(api.list_artifacts(sid))
+        result = run_async(api, api.list_artifacts(sid))
         artifacts = result.get("artifacts", [])
         ui.print_artifacts_table(artifacts)
 
@@ -385,7 +478,7 @@ def show_artifact(
         raise typer.Exit(1)
 
     try:
-        artifact = asyncio.run(api.get_artifact(sid, artifact_id))
+        artifact = run_async(api, api.get_artifact(sid, artifact_id))
         ui.print_artifact_content(artifact)
 
     except Exception as e:
@@ -1,12 +1,17 @@
 """Rich UI 组件"""
 
-import re
+import queue
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
+import re2
 from rich.console import Console
 from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
+from rich.rule import Rule
 from rich.table import Table
 from rich.text import Text
 from rich.spinner import Spinner
@@ -14,11 +19,35 @@ from rich.spinner import Spinner
 from .api_client import SSEEvent
 
 # 检测 XML 标签的正则：<tagname> 或 </tagname> 或 <tagname ...>
-XML_TAG_PATTERN = re.compile(r'</?[a-zA-Z_][a-zA-Z0-9_]*(?:\s[^>]*)?\s*/?>')
+# 用 RE2（线性时间）：stdlib re 在大量未闭合的 "<tag " 上 [^>]* 逐起点回溯，O(n²)，
+# 长回复里可以卡住渲染线程数十秒
+XML_TAG_PATTERN = re2.compile(r'</?[a-zA-Z_][a-zA-Z0-9_]*(?:\s[^>]*)?\s*/?>')
+
+# Live 中 reasoning 面板最多渲染的末尾字符数（按行对齐）
+LIVE_REASONING_TAIL_CHARS = 2000
+
+# 渲染队列上限：队满时 handle_event 阻塞读 SSE 的一方，终端卡住时压力经 TCP 传回
+# 服务端。每个积压的 llm_chunk 都带截至当时的全文，不设上限内存会按 O(n²) 增长
+RENDER_QUEUE_MAXSIZE = 64
 
 console = Console()
 
 
+@lru_cache(maxsize=128)
+def _markup(text: str) -> Text:
+    """
+    解析并缓存 Rich markup（Live 每帧都要渲染的面板标题用）。
+
+    Panel 渲染标题时会 copy 传入的 Text，缓存的实例不会被改写。
+    """
+    return Text.from_markup(text)
+
+
+def _truncate(text: str, limit: int) -> str:
+    """超过 limit 时截断并以 ... 结尾（总长不超过 limit）"""
+    return text if len(text) <= limit else f"{text[:limit - 3]}..."
+
+
 def print_error(message: str):
     """打印错误信息"""
     console.print(f"[red]Error:[/red] {message}")
@@ -55,6 +84,21 @@ def print_permission_request(tool_name: str, level: str, params: dict):
     ))
 
 
+@dataclass(frozen=True, slots=True)
+class _Frame:
+    """Live 一帧所需的显示状态快照。
+
+    事件由渲染线程逐字段改写，Live 刷新线程若直接读这些字段，可能拼出半新半旧的
+    一帧（如 rendering 已切到 content、content 还是上一批的）。渲染线程每应用完
+    一批事件整体发布一次快照，Live 只读快照。
+    """
+    agent: Optional[str] = None
+    rendering: Optional[str] = None    # "reasoning" | "content" | None
+    text: str = ""                     # reasoning 末尾窗口 / content 未冻结的尾巴
+    tool: Optional[str] = None
+    tool_params_str: str = ""
+
+
 class StreamDisplay:
     """
     流式输出显示器
@@ -66,6 +110,14 @@ class StreamDisplay:
     - Live 只负责渲染当前正在更新的内容
     """
 
+    # handle_event 实际处理的事件类型（与下方分支保持一致）；
+    # main._stream_events 据此让 api_client 跳过无人消费的事件
+    HANDLED_EVENT_TYPES = frozenset({
+        "agent_start", "llm_chunk", "llm_complete", "tool_start", "tool_complete",
+        "agent_complete", "permission_request", "permission_result",
+        "compaction_start", "compaction_summary", "cancelled",
+    })
+
     def __init__(self):
         # 当前正在流式输出的内容
         self.current_agent: Optional[str] = None
@@ -75,11 +127,49 @@ class StreamDisplay:
         self.reasoning_printed: bool = False
         # 追踪当前正在渲染的是什么（"reasoning" | "content" | None）
         self.current_rendering: Optional[str] = None
+        # current_content 中已冻结并打印到滚动历史的前缀长度；Live 只渲染其后的尾巴
+        self._content_flushed: int = 0
+        # current_content 中已扫描过段落边界的长度（累积内容只需扫新增部分）
+        self._content_scanned: int = 0
         # 当前执行中的工具
         self.current_tool: Optional[str] = None
         self.current_tool_params: Optional[dict] = None
+        # 工具参数的格式化串（未截断）：参数在执行期间不变，tool_start 时格式化一次，
+        # Live 每帧与 tool_complete 都复用，不再逐帧 repr
+        self._tool_params_str: str = ""
         # Live 对象
         self.live: Live | None = None
+        # 渲染线程：start() 后 handle_event 只把事件入队，Markdown 渲染与终端写入
+        # 都在该线程里做，不占用读 SSE 的事件循环。队列有界（见 RENDER_QUEUE_MAXSIZE）。
+        # None 为停止哨兵
+        self._event_q: queue.Queue[SSEEvent | None] = queue.Queue(maxsize=RENDER_QUEUE_MAXSIZE)
+        self._render_thread: threading.Thread | None = None
+        self._render_error: BaseException | None = None
+        # Live 刷新线程读取的最新快照（见 _Frame）；整体替换引用，读写无需加锁
+        self._frame = _Frame()
+        # Spinner 的动画相位取决于实例首次渲染时间，Live 每帧经 get_renderable 重建
+        # 会让它永远停在第一帧，所以按文案复用实例
+        self._spinners: dict[str, Spinner] = {}
+        # 无 agent / 工具时的等待面板完全静态，构造一次复用
+        self._waiting_panel = Panel(
+            self._spinner("Waiting..."),
+            title="[dim]ArtifactFlow[/dim]",
+            border_style="dim",
+        )
+
+    @staticmethod
+    def _format_tool_params(params: Optional[dict]) -> str:
+        """格式化工具参数（每个值 repr 截到 30 字符）"""
+        if not params:
+            return ""
+        return ", ".join(f"{k}={repr(v)[:30]}" for k, v in params.items())
+
+    def _spinner(self, text: str) -> Spinner:
+        """按文案取复用的 Spinner"""
+        spinner = self._spinners.get(text)
+        if spinner is None:
+            spinner = self._spinners[text] = Spinner("dots", text=text)
+        return spinner
 
     def _print_reasoning_complete(self, name: str, reasoning: str):
         """打印已完成的 reasoning Panel（浅色框）"""
@@ -93,22 +183,56 @@ class StreamDisplay:
         )
         console.print(panel)
 
+    @staticmethod
+    def _render_content_block(content: str) -> Text | Markdown:
+        """已完成的 content 渲染：含 XML 标签用 Text，避免 Markdown 解析产生空行"""
+        # 先用 '<' in 做 C 级单字符扫描：纯 Markdown 回复（绝大多数）不进正则
+        if "<" in content and XML_TAG_PATTERN.search(content):
+            return Text(content)
+        return Markdown(content)
+
     def _print_agent_complete(self, name: str, content: str):
         """打印已完成的 agent content Panel"""
         if not content.strip():
             return
-        # 检测是否包含 XML 标签，如果是就用 Text 避免 Markdown 解析产生空行
-        if XML_TAG_PATTERN.search(content):
-            rendered = Text(content)
-        else:
-            rendered = Markdown(content)
         panel = Panel(
-            rendered,
+            self._render_content_block(content),
             title=f"[cyan]{name}[/cyan]",
             border_style="cyan",
         )
         console.print(panel)
 
+    def _flush_stable_content(self):
+        """
+        把 current_content 尾巴里已稳定的段落冻结并打印到滚动历史。
+
+        API 推送的是累积内容，若每帧都把整段 content 交给 Live 渲染，长回复的总渲染量
+        是 O(n²)。以空行（段落边界）为界，边界之前的文本不会再变，打印一次即可；
+        Live 只渲染最后一个未完成的段落。代码块（```）内部的空行不切，避免把一个
+        fence 拆成两段各自渲染。首次冻结时先打印一条带 agent 名的标题线，
+        后续段落与最终尾巴接在其下（短回复从未冻结时仍整体打印成 Panel）。
+        """
+        content = self.current_content
+        start = self._content_flushed
+        # 只在本次新增的部分里找边界（回退 1 个字符，覆盖跨 chunk 的 "\n\n"）：
+        # 更早的候选上一轮已判定过——要么已冻结，要么落在未闭合的 fence 里，
+        # 而某位置是否在 fence 内不随后续内容改变。每个 chunk 的扫描量是 O(增量)。
+        lo = max(start, self._content_scanned - 1)
+        self._content_scanned = len(content)
+        cut = content.rfind("\n\n", lo)
+        # 切点落在未闭合的代码块内时往前找，直到 fence 配平
+        while cut != -1 and content.count("```", start, cut) % 2:
+            cut = content.rfind("\n\n", lo, cut)
+        if cut == -1:
+            return
+
+        block = content[start:cut]
+        if start == 0:
+            console.print(Rule(f"[cyan]{self.current_agent or 'Agent'}[/cyan]", style="cyan", align="left"))
+        if block.strip():
+            console.print(self._render_content_block(block))
+        self._content_flushed = cut + 2
+
     def _print_tool_complete(self, name: str, content: str, success: bool):
         """打印已完成的 tool Panel"""
         status = "[green]✓[/green]" if success else "[red]✗[/red]"
@@ -122,29 +246,51 @@ class StreamDisplay:
         )
         console.print(panel)
 
-    def _render_current(self) -> Panel:
+    def _publish_frame(self):
+        """把当前显示状态整体发布为 Live 读取的快照（只在渲染线程 / 同步应用时调用）"""
+        text = ""
+        if self.current_rendering == "reasoning":
+            # reasoning 是 transient 的，不冻结进滚动历史；只取末尾一个有界窗口，
+            # 每帧开销不随 reasoning 总长增长
+            text = self.current_reasoning
+            if len(text) > LIVE_REASONING_TAIL_CHARS:
+                text = text[-LIVE_REASONING_TAIL_CHARS:]
+                text = text[text.find("\n") + 1:]
+        elif self.current_rendering == "content":
+            # 已冻结的段落已在滚动历史里，只取尚未稳定的尾巴
+            text = self.current_content[self._content_flushed:]
+        self._frame = _Frame(
+            agent=self.current_agent,
+            rendering=self.current_rendering,
+            text=text,
+            tool=self.current_tool,
+            tool_params_str=self._tool_params_str,
+        )
+
+    def _render_current(self, frame: _Frame) -> Panel:
         """渲染当前正在流式输出的内容（用于 Live）"""
-        # 根据 current_rendering 决定渲染什么
+        # 根据 rendering 决定渲染什么
         # 注意：流式阶段统一用 Text()，Markdown() 会在内容变化时产生空行
-        if self.current_rendering == "reasoning":
+        agent = frame.agent or "Agent"
+        if frame.rendering == "reasoning":
             # 渲染 reasoning（浅色框）
             return Panel(
-                Text(self.current_reasoning, style="dim") if self.current_reasoning else Spinner("dots", text="Thinking..."),
-                title=f"[dim]{self.current_agent or 'Agent'} (thinking)[/dim]",
+                Text(frame.text, style="dim") if frame.text else self._spinner("Thinking..."),
+                title=_markup(f"[dim]{agent} (thinking)[/dim]"),
                 border_style="dim",
             )
-        elif self.current_rendering == "content":
+        elif frame.rendering == "content":
             # 渲染 content（正常框，但流式阶段用 Text 避免空行）
             return Panel(
-                Text(self.current_content) if self.current_content else Spinner("dots", text="Responding..."),
-                title=f"[cyan]{self.current_agent or 'Agent'}[/cyan]",
+                Text(frame.text) if frame.text else self._spinner("Responding..."),
+                title=_markup(f"[cyan]{agent}[/cyan]"),
                 border_style="blue",
             )
         else:
             # 初始状态
             return Panel(
-                Spinner("dots", text="Thinking..."),
-                title=f"[cyan]{self.current_agent or 'Agent'}[/cyan]",
+                self._spinner("Thinking..."),
+                title=_markup(f"[cyan]{agent}[/cyan]"),
                 border_style="blue",
             )
 
@@ -172,11 +318,11 @@ class StreamDisplay:
                     return f"{msg} (v{version})"
                 return msg
 
-            # 其他返回 dict 的工具：显示 key 列表
-            keys = list(result_data.keys())
-            if len(keys) <= 3:
-                return ", ".join(f"{k}: {repr(result_data[k])[:30]}" for k in keys)
-            return f"{len(keys)} fields returned"
+            # 其他返回 dict 的工具：≤3 个字段逐个显示，否则只报字段数
+            # （len 是 O(1)：大 dict 不物化 key 列表，也不碰任何值）
+            if len(result_data) <= 3:
+                return ", ".join(f"{k}: {repr(v)[:30]}" for k, v in result_data.items())
+            return f"{len(result_data)} fields returned"
 
         if isinstance(result_data, str):
             # 搜索/抓取工具：返回的是 XML 字符串，显示长度摘要
@@ -186,37 +332,31 @@ class StreamDisplay:
 
         return str(result_data)[:80]
 
-    def _render_tool_executing(self) -> Panel:
+    def _render_tool_executing(self, frame: _Frame) -> Panel:
         """渲染正在执行的工具"""
         # 格式化参数显示
-        if self.current_tool_params:
-            params_str = ", ".join(f"{k}={repr(v)[:30]}" for k, v in self.current_tool_params.items())
-            if len(params_str) > 80:
-                params_str = params_str[:77] + "..."
-            content = Text(f"({params_str})", style="dim")
+        if frame.tool_params_str:
+            content = Text(f"({_truncate(frame.tool_params_str, 80)})", style="dim")
         else:
-            content = Spinner("dots", text="Executing...")
+            content = self._spinner("Executing...")
 
         return Panel(
             content,
-            title=f"[yellow]⋯[/yellow] Tool: {self.current_tool}",
+            title=_markup(f"[yellow]⋯[/yellow] Tool: {frame.tool}"),
             border_style="yellow",
             padding=(0, 1),
         )
 
     def _render(self) -> Panel:
-        """渲染当前正在执行的内容（只用于 Live）"""
+        """渲染当前正在执行的内容（只用于 Live，由其刷新线程调用，只读快照）"""
+        frame = self._frame
         # 优先渲染工具，否则渲染 agent
-        if self.current_tool:
-            return self._render_tool_executing()
-        elif self.current_agent:
-            return self._render_current()
+        if frame.tool:
+            return self._render_tool_executing(frame)
+        elif frame.agent:
+            return self._render_current(frame)
         else:
-            return Panel(
-                Spinner("dots", text="Waiting..."),
-                title="[dim]ArtifactFlow[/dim]",
-                border_style="dim",
-            )
+            return self._waiting_panel
 
     def _finalize_reasoning(self):
         """标记 reasoning 为已完成（不打印，只在 Live 中显示）"""
@@ -230,17 +370,91 @@ class StreamDisplay:
         if self.current_agent:
             # 先打印 reasoning（如果有且未打印）
             self._finalize_reasoning()
-            # 再打印 content（如果有）
-            if self.current_content.strip():
+            # 再打印 content（如果有）：从未冻结过则整体打印成 Panel，
+            # 否则只补打印剩余尾巴，接在已打印的段落之后
+            if self._content_flushed:
+                tail = self.current_content[self._content_flushed:]
+                if tail.strip():
+                    console.print(self._render_content_block(tail))
+            elif self.current_content.strip():
                 self._print_agent_complete(self.current_agent, self.current_content)
         # 清空当前状态
         self.current_content = ""
+        self._content_flushed = 0
+        self._content_scanned = 0
         self.current_reasoning = ""
         self.reasoning_printed = False
         self.current_rendering = None
 
     def handle_event(self, event: SSEEvent):
-        """处理 SSE 事件"""
+        """
+        处理 SSE 事件
+
+        渲染线程运行时只入队，由线程按序应用；未 start() 时同步应用。
+        渲染线程跟得上时不阻塞；积压到 RENDER_QUEUE_MAXSIZE 时阻塞调用方（背压）。
+        CLI 的事件循环只服务这一条流，阻塞它即停止读 socket。
+        """
+        if self._render_thread is not None:
+            self._event_q.put(event)
+        else:
+            self._apply_event(event)
+            self._publish_frame()
+
+    def flush(self):
+        """等待已入队的事件全部渲染完（调用方要直接往终端打印前先同步顺序）"""
+        if self._render_thread is not None:
+            self._event_q.join()
+
+    @staticmethod
+    def _coalesce(batch: list[SSEEvent]) -> list[SSEEvent]:
+        """
+        合并积压的 llm_chunk：内容是累积的，同一 agent、同一字段（content /
+        reasoning_content）的连续 chunk 只需应用最后一个
+        """
+        if len(batch) == 1:
+            return batch
+        kept: list[SSEEvent] = []
+        prev_key = None
+        for event in batch:
+            if event.type == "llm_chunk":
+                key = (event.agent, "content" in event.data)
+                if key == prev_key:
+                    kept[-1] = event
+                    continue
+                prev_key = key
+            else:
+                prev_key = None
+            kept.append(event)
+        return kept
+
+    def _render_loop(self):
+        """渲染线程主循环：批量取出积压事件，合并后按序应用"""
+        q = self._event_q
+        while True:
+            batch = [q.get()]
+            while True:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            stop = batch[-1] is None
+            events = [e for e in batch if e is not None]
+            try:
+                for event in self._coalesce(events):
+                    self._apply_event(event)
+            except Exception as e:
+                # 记下首个错误由 stop() 交还调用方；线程继续消费，避免 flush/stop 卡死
+                if self._render_error is None:
+                    self._render_error = e
+            finally:
+                self._publish_frame()
+                for _ in batch:
+                    q.task_done()
+            if stop:
+                return
+
+    def _apply_event(self, event: SSEEvent):
+        """应用单个 SSE 事件到显示状态"""
         if event.type == "agent_start":
             # 保存之前的 agent 内容
             self._finalize_current_agent()
@@ -251,23 +465,28 @@ class StreamDisplay:
             self.current_rendering = None
 
         elif event.type == "llm_chunk":
-            # 更新内容（API 返回的是累积内容）
-            new_content = event.data.get("content", "")
-            new_reasoning = event.data.get("reasoning_content") or ""
-
-            # 检测从 reasoning 切换到 content 的时机
-            if new_content and not self.current_content:
-                # 第一次收到 content，先把 reasoning 打印出来
-                if self.current_reasoning and not self.reasoning_printed:
-                    self._finalize_reasoning()
-                # 切换到渲染 content
-                self.current_rendering = "content"
-            elif new_reasoning and not self.current_rendering:
-                # 第一次收到 reasoning
-                self.current_rendering = "reasoning"
-
-            self.current_content = new_content
-            self.current_reasoning = new_reasoning
+            # 更新内容（API 返回的是累积内容）。每个 chunk 只携带 content 或
+            # reasoning_content 其一，只更新出现的那个，缺席的一侧保持不变
+            data = event.data
+            new_content = data.get("content")
+            new_reasoning = data.get("reasoning_content")
+
+            if new_content is not None:
+                # 检测从 reasoning 切换到 content 的时机
+                if new_content and not self.current_content:
+                    # 第一次收到 content，先把 reasoning 打印出来
+                    if self.current_reasoning and not self.reasoning_printed:
+                        self._finalize_reasoning()
+                    # 切换到渲染 content
+                    self.current_rendering = "content"
+                self.current_content = new_content
+                self._flush_stable_content()
+
+            if new_reasoning is not None:
+                if new_reasoning and not self.current_rendering:
+                    # 第一次收到 reasoning
+                    self.current_rendering = "reasoning"
+                self.current_reasoning = new_reasoning
 
         elif event.type == "llm_complete":
             # 某些 provider 只在终结块给最终 content / reasoning（中途没有 llm_chunk），
@@ -297,12 +516,18 @@ class StreamDisplay:
             self._finalize_current_agent()
             self.current_tool = event.data.get("tool")
             self.current_tool_params = event.data.get("params", {})
+            self._tool_params_str = self._format_tool_params(self.current_tool_params)
 
         elif event.type == "tool_complete":
             # 工具完成，打印结果（不重启 Live）
             # 优先使用事件 data 中的 tool 名（subagent 返回时 self.current_tool 已被清空）
             tool_name = event.data.get("tool") or self.current_tool or "unknown"
-            tool_params = event.data.get("params") or self.current_tool_params
+            tool_params = event.data.get("params")
+            # 与 tool_start 的参数一致（常态）时复用缓存串，否则现格式化
+            if not tool_params or tool_params == self.current_tool_params:
+                params_str = self._tool_params_str
+            else:
+                params_str = self._format_tool_params(tool_params)
             success = event.data.get("success", True)
             duration_ms = event.data.get("duration_ms", 0)
             error = event.data.get("error")
@@ -310,11 +535,8 @@ class StreamDisplay:
 
             # 构建显示内容：参数 + 耗时/错误 + 返回数据摘要
             parts = []
-            if tool_params:
-                params_str = ", ".join(f"{k}={repr(v)[:30]}" for k, v in tool_params.items())
-                if len(params_str) > 60:
-                    params_str = params_str[:57] + "..."
-                parts.append(f"({params_str})")
+            if params_str:
+                parts.append(f"({_truncate(params_str, 60)})")
 
             if success:
                 parts.append(f"[{duration_ms}ms]")
@@ -332,6 +554,7 @@ class StreamDisplay:
             self._print_tool_complete(tool_name, content, success)
             self.current_tool = None
             self.current_tool_params = None
+            self._tool_params_str = ""
 
         elif event.type == "agent_complete":
             # Agent 完成，保存到历史
@@ -384,28 +607,42 @@ class StreamDisplay:
             self._finalize_current_agent()
             self.current_tool = None
 
-        # 更新显示
-        if self.live:
-            self.live.update(self._render())
+        # 不在这里渲染：Live 按 refresh_per_second 节拍经 get_renderable 拉取最新状态，
+        # 一个刷新周期内的多次 llm_chunk 只合并成一帧，渲染开销与事件速率解耦
 
     def start(self):
         """开始 Live 显示"""
         # transient=True: 停止时清除动态内容
         # vertical_overflow="visible": 允许内容高度自由变化，避免保留旧高度导致空行
         self.live = Live(
-            self._render(),
             console=console,
+            get_renderable=self._render,
             refresh_per_second=10,
             transient=True,
             vertical_overflow="ellipsis"
         )
         self.live.start()
+        self._render_thread = threading.Thread(
+            target=self._render_loop, name="stream-display", daemon=True,
+        )
+        self._render_thread.start()
 
-    def stop(self):
-        """停止 Live 显示"""
+    def stop(self) -> BaseException | None:
+        """
+        停止 Live 显示（先渲染完已入队的事件）
+
+        不抛异常：stop() 常在 finally / 权限提示前调用，在这里抛会盖掉调用方正在
+        传播的网络 / 取消异常，或打断权限确认。渲染线程的首个错误保留在实例上并
+        作为返回值交还，由调用方在没有异常传播时决定是否重新抛出。
+        """
+        if self._render_thread is not None:
+            self._event_q.put(None)
+            self._render_thread.join()
+            self._render_thread = None
         if self.live:
             self.live.stop()
             self.live = None
+        return self._render_error
 
 
 def print_conversations_table(conversations: list):
@@ -416,15 +653,18 @@ def print_conversations_table(conversations: list):
     table.add_column("Messages", justify="right")
     table.add_column("Created", style="dim")
 
-    for conv in conversations:
-        conv_id = conv["id"][:8] + "..."  # 截短 ID
-        title = conv.get("title") or "(No title)"
-        if len(title) > 40:
-            title = title[:37] + "..."
-        msg_count = str(conv.get("message_count", "-"))
-        created = conv.get("created_at", "-")[:16]  # 只显示日期时间
-
-        table.add_row(conv_id, title, msg_count, created)
+    # 先一趟预处理出截断好的行，再逐行 add_row
+    rows = [
+        (
+            f"{conv['id'][:8]}...",  # 截短 ID
+            _truncate(conv.get("title") or "(No title)", 40),
+            str(conv.get("message_count", "-")),
+            conv.get("created_at", "-")[:16],  # 只显示日期时间
+        )
+        for conv in conversations
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -448,10 +688,8 @@ def print_conversation_detail(conv: dict):
             user_input = msg.get("user_input", "") or ""
             response = msg.get("response") or ""
 
-            if len(user_input) > 200:
-                user_input = user_input[:197] + "..."
-            if len(response) > 200:
-                response = response[:197] + "..."
+            user_input = _truncate(user_input, 200)
+            response = _truncate(response, 200)
 
             console.print(f"  [green]user:[/green] {user_input}")
             if response:
@@ -473,16 +711,18 @@ def print_artifacts_table(artifacts: list):
     table.add_column("Version", justify="right")
     table.add_column("Updated", style="dim")
 
-    for art in artifacts:
-        art_id = art["id"]  # Show full ID for copying
-        title = art.get("title", "(No title)")
-        if len(title) > 30:
-            title = title[:27] + "..."
-        art_type = art.get("content_type", "-")  # API uses content_type, not artifact_type
-        version = f"v{art.get('current_version', 1)}"
-        updated = art.get("updated_at", "-")[:16]
-
-        table.add_row(art_id, title, art_type, version, updated)
+    rows = [
+        (
+            art["id"],  # Show full ID for copying
+            _truncate(art.get("title", "(No title)"), 30),
+            art.get("content_type", "-"),  # API uses content_type, not artifact_type
+            f"v{art.get('current_version', 1)}",
+            art.get("updated_at", "-")[:16],
+        )
+        for art in artifacts
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -22,6 +22,23 @@ from dotenv import load_dotenv
 # 加载环境变量
 load_dotenv()
 
+# 启动横幅模板。只由 main() 打印：--workers>1 时 uvicorn 以 spawn 方式起 worker，
+# 子进程把本脚本作为 __mp_main__ 导入，不会走到 __main__ 分支，横幅不会重复输出
+BANNER = """
+╔══════════════════════════════════════════════════════════════╗
+║                    ArtifactFlow API Server                   ║
+╠══════════════════════════════════════════════════════════════╣
+║  Host: {host:<53} ║
+║  Port: {port:<53} ║
+║  Workers: {workers:<50} ║
+║  Reload: {reload:<51} ║
+║  Log Level: {log_level:<48} ║
+╠══════════════════════════════════════════════════════════════╣
+║  Swagger UI: {docs_url:<47} ║
+║  ReDoc:      {redoc_url:<47} ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
 
 def main():
     parser = argparse.ArgumentParser(description="ArtifactFlow API Server")
@@ -58,26 +75,20 @@ def main():
 
     args = parser.parse_args()
 
-    # 构造友好的显示 URL
-    # 如果绑定 0.0.0.0，显示 localhost 方便点击，否则显示实际 host
-    display_host = "localhost" if args.host == "0.0.0.0" else args.host
-    docs_url = f"http://{display_host}:{args.port}/docs"
-    redoc_url = f"http://{display_host}:{args.port}/redoc"
-
-    print(f"""
-╔══════════════════════════════════════════════════════════════╗
-║                    ArtifactFlow API Server                   ║
-╠══════════════════════════════════════════════════════════════╣
-║  Host: {args.host:<53} ║
-║  Port: {args.port:<53} ║
-║  Workers: {args.workers:<50} ║
-║  Reload: {str(args.reload):<51} ║
-║  Log Level: {args.log_level:<48} ║
-╠══════════════════════════════════════════════════════════════╣
-║  Swagger UI: {docs_url:<47} ║
-║  ReDoc:      {redoc_url:<47} ║
-╚══════════════════════════════════════════════════════════════╝
-""")
+    # critical 级别意味着只想看致命错误，横幅也一并省掉
+    if args.log_level != "critical":
+        # 如果绑定 0.0.0.0，显示 localhost 方便点击，否则显示实际 host
+        display_host = "localhost" if args.host == "0.0.0.0" else args.host
+        base_url = f"http://{display_host}:{args.port}"
+        print(BANNER.format(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            reload=str(args.reload),
+            log_level=args.log_level,
+            docs_url=f"{base_url}/docs",
+            redoc_url=f"{base_url}/redoc",
+        ))
 
     # 配置 uvicorn
     uvicorn_kwargs = {
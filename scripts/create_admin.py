@@ -40,6 +40,9 @@ async def main(username: str, password: str, no_claim: bool) -> None:
     await db.initialize()
 
     try:
+        # 建号/升级与认领 conversation 在同一事务里，末尾一次 commit：不会出现
+        # admin 已落库但认领失败的半成品状态。这里直接操作 session，不走
+        # repo.add/update（它们各自 commit）
         async with db.session() as session:
             user_repo = UserRepository(session)
 
@@ -56,7 +59,6 @@ async def main(username: str, password: str, no_claim: bool) -> None:
                     existing.is_active = True
                     changed.append("is_active → True")
                 if changed:
-                    await user_repo.update(existing)
                     print(f"User '{username}' already exists (id={user_id}), upgraded: {', '.join(changed)}")
                 else:
                     print(f"User '{username}' already exists (id={user_id}), already admin")
@@ -73,7 +75,9 @@ async def main(username: str, password: str, no_claim: bool) -> None:
                     # 「password_changed_at IS NULL → 视为到期」误触发首次强制改密。
                     password_changed_at=utc_now(),
                 )
-                await user_repo.add(user)
+                session.add(user)
+                # session 关了 autoflush：先把 INSERT 发出去，认领 UPDATE 的外键才指得到
+                await session.flush()
                 print(f"Admin user created: {username} (id={user_id})")
 
             # 将所有 user_id IS NULL 的 conversation 归属到新 admin
@@ -83,13 +87,14 @@ async def main(username: str, password: str, no_claim: bool) -> None:
                     .where(Conversation.user_id.is_(None))
                     .values(user_id=user_id)
                 )
-                await session.commit()
                 claimed = result.rowcount
                 if claimed > 0:
                     print(f"Claimed {claimed} existing conversation(s) with no owner")
                 else:
                     print("No unclaimed conversations found")
 
+            await session.commit()
+
     finally:
         await db.close()
 
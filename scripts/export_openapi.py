@@ -5,10 +5,11 @@
 每次后端 API schema 变更后运行，前端再执行 npm run generate-types 刷新 TS 类型。
 """
 
-import json
 import os
 import sys
 
+import orjson
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from api.main import app
@@ -31,7 +32,9 @@ output_path = os.path.join(
 )
 os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-with open(output_path, "w") as f:
-    json.dump(schema, f, indent=2)
+# orjson 直接产出 UTF-8 bytes（中文描述不再转义成 \uXXXX），缩进格式与
+# json.dump(indent=2) 相同，diff 只在转义字符处
+with open(output_path, "wb") as f:
+    f.write(orjson.dumps(schema, option=orjson.OPT_INDENT_2))
 
 print(f"OpenAPI schema exported to {output_path}")
@@ -6,7 +6,7 @@ def parse_requirements(filename: str) -> list[str]:
     """解析 requirements.txt，忽略注释和空行"""
     requirements = []
     for line in Path(filename).read_text().splitlines():
-        line = line.split("#")[0].strip()  # 移除行内注释
+        line = line.partition("#")[0].strip()  # 移除行内注释
         if line:
             requirements.append(line)
     return requirements
@@ -35,6 +35,7 @@ class Settings(BaseSettings):
     STREAM_TTL_GRACE: int = 300
     PERMISSION_TIMEOUT: int = 300  # 秒，单次 permission 等待超时
     CANCEL_CHECK_INTERVAL: float = 0.5  # 秒，LLM 流式输出期间轮询 cancel 的最小间隔（避免每 chunk 一次 Redis GET）
+    TOOL_RESULT_CACHE_SIZE: int = 64  # 单 turn 内 cacheable 工具（web_search/web_fetch）结果缓存条数上限（LRU）
 
     # Compaction / Context 配置
     COMPACTION_TOKEN_THRESHOLD: int = 100000  # tokens, LLM 单次调用 input+output 超此值触发引擎内 compaction
@@ -18,6 +18,7 @@ In-engine compaction — 引擎内同步触发的上下文压缩
 """
 
 import asyncio
+import time
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from config import config
@@ -257,7 +258,7 @@ class CompactionRunner:
                 f"{len(events_to_compact)} events):\n{format_messages_for_debug(messages)}"
             )
 
-        start = utc_now()
+        start = time.monotonic()
         response = ""
         usage = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
 
@@ -301,7 +302,7 @@ class CompactionRunner:
         else:
             await _guarded_stream()
 
-        duration_ms = int((utc_now() - start).total_seconds() * 1000)
+        duration_ms = int((time.monotonic() - start) * 1000)
 
         # The entire response is the summary — compact_agent is instructed to
         # emit the numbered sections directly with no outer wrapper. We do NOT
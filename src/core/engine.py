@@ -5,7 +5,7 @@
 - 唯一的抽象是 context 构建
 - call_llm → parse_tool_calls → 串行执行 → route → repeat
 - Interrupt = asyncio.Event（in-memory await）
-- 多工具支持（parse_tool_calls 返回列表，串行执行）
+- 多工具支持（parse_tool_calls 返回列表，按序执行；连续的 concurrency_safe 调用成段并发）
 - Tool limit → 注入 system message 提醒总结
 """
 
@@ -14,8 +14,11 @@ import math
 import time
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, Callable, Awaitable, List, Tuple, TypedDict, Union
+from collections import OrderedDict
 from datetime import datetime
 
+import orjson
+
 from config import config
 from core.events import StreamEventType, ExecutionEvent
 from core.context_manager import ContextManager
@@ -221,6 +224,9 @@ async def execute_loop(
 
     message_id = state["message_id"]
     tool_round_count: Dict[str, int] = {}  # per-agent tool round counter
+    # 本 turn 内 cacheable 工具的结果缓存:(tool_name, 规范化 params) → 收尾后的 ToolResult
+    # (已过落盘中间件,命中时不会重复落盘)。turn 级生命周期,不跨 turn 复用过期结果
+    tool_result_cache: "OrderedDict[Tuple[str, bytes], ToolResult]" = OrderedDict()
 
     async def _is_cancelled() -> bool:
         """零参谓词：协作式 cancel flag（预绑定 message_id）——所有消费点的唯一入口。
@@ -492,7 +498,7 @@ async def execute_loop(
         Returns:
             (response_content, reasoning_content, token_usage) 或 None（LLM 出错，state 已设置）
         """
-        llm_start_time = utc_now()
+        llm_start_time = time.monotonic()
 
         response_content = ""
         reasoning_content = None
@@ -563,7 +569,7 @@ async def execute_loop(
             # 把已累积的部分内容作为 llm_complete 持久化 —— events 是历史 source of
             # truth，下一轮恢复时模型能看到自己说到一半的内容。流式中途通常还没收到
             # usage chunk，token_usage 置零即可（本轮 metrics 不再补算）。
-            llm_duration_ms = int((utc_now() - llm_start_time).total_seconds() * 1000)
+            llm_duration_ms = int((time.monotonic() - llm_start_time) * 1000)
             await _emit(StreamEventType.LLM_COMPLETE.value, agent_name, {
                 "content": response_content,
                 "reasoning_content": reasoning_content,
@@ -582,8 +588,7 @@ async def execute_loop(
             logger.info(f"[{agent_name}] LLM stream cancelled mid-flight, partial content persisted")
             return None
 
-        llm_end_time = utc_now()
-        llm_duration_ms = int((llm_end_time - llm_start_time).total_seconds() * 1000)
+        llm_duration_ms = int((time.monotonic() - llm_start_time) * 1000)
 
         # Map LiteLLM keys (prompt_tokens/completion_tokens) to unified keys (input_tokens/output_tokens)
         normalized_usage = {
@@ -831,15 +836,217 @@ async def execute_loop(
         persisted.metadata["original_size_chars"] = len(data)
         return persisted
 
+    async def _invoke_tool(tool: BaseTool, params: dict, agent_name: str) -> ToolResult:
+        """调用工具本体；工具异常折成 success=False 的 ToolResult（取消类异常原样穿透）。"""
+        tool_name = tool.name
+        try:
+            # wants_context 工具(如 search_tools)在 execute 期需要引擎上下文(调用方
+            # agent 的可调视图 + 本 turn 工具注册表):调用时注入 ToolExecutionContext,
+            # 不存实例态(进程级实例并发 turn 共享,故 per-call 注入而非 per-instance)。
+            # context 只装非密事实(secret 走 B-4 credential resolver,不走这条)。
+            # 协程构造放 try 内:`tool(...)` 的**参数绑定**在 call 那一刻同步发生(协程
+            # 体尚未运行),任何绑定异常(如模型误吐 `_context` 与注入键撞车)需被这层
+            # per-tool except 接住、降级为单工具失败,而非漏到 turn 级掀翻整轮。
+            if getattr(tool, "wants_context", False):
+                return await tool(_context=ToolExecutionContext(
+                    agent_name=agent_name,
+                    effective_toolset=effective_toolsets[agent_name],
+                    tools=tools,
+                ), **params)
+            return await tool(**params)
+        except Exception as e:
+            logger.exception(f"Tool '{tool_name}' execution error: {e}")
+            return ToolResult(success=False, error=str(e))
+
+    def _tool_cache_key(tool: BaseTool, tool_call) -> Optional[Tuple[str, bytes]]:
+        if not getattr(tool, "cacheable", False):
+            return None
+        try:
+            return tool_call.name, orjson.dumps(tool_call.params, option=orjson.OPT_SORT_KEYS, default=str)
+        except orjson.JSONEncodeError:
+            # 超 64 位整数 / 非 str 键不走 default，直接抛 —— 当作不可缓存，
+            # 交给工具本身去报错，而不是让编码异常掀翻整轮
+            return None
+
+    def _cached_tool_result(tool: BaseTool, tool_call) -> Optional[ToolResult]:
+        key = _tool_cache_key(tool, tool_call)
+        if key is None or key not in tool_result_cache:
+            return None
+        tool_result_cache.move_to_end(key)
+        logger.debug(f"Tool '{tool_call.name}' served from turn cache")
+        return tool_result_cache[key]
+
+    def _cancelled_tool_result() -> ToolResult:
+        return ToolResult(
+            success=False,
+            error=(
+                "Cancelled by user while the tool was running. "
+                "Side effects may or may not have been applied "
+                "(the operation was already in flight)."
+            ),
+        )
+
+    async def _finish_tool(tool_call, tool: BaseTool, tool_result: ToolResult, tool_duration_ms: int, agent_name: str) -> None:
+        """工具执行后的统一收尾：落盘中间件 → 识图摘块 → skill 激活 → TOOL_COMPLETE。"""
+        tool_name = tool_call.name
+        params = tool_call.params
+
+        # 超长成功结果统一落盘为 artifact，回填预览（fail-open）
+        tool_result = await _maybe_persist_tool_result(tool_name, tool, tool_result)
+
+        cache_key = _tool_cache_key(tool, tool_call) if tool_result.success else None
+        if cache_key is not None:
+            tool_result_cache[cache_key] = tool_result
+            tool_result_cache.move_to_end(cache_key)
+            if len(tool_result_cache) > config.TOOL_RESULT_CACHE_SIZE:
+                tool_result_cache.popitem(last=False)
+
+        # 识图:把图块 data-URI 从将入事件的 metadata 里摘出 → 存进本 turn 的
+        # state["vision_blocks"](仅内存、不持久化、跨轮自然失效);事件只留引用
+        # (artifact_id/version/content_type)。context build 据 state 还原:本轮命中
+        # → 注入图块;下一轮 state 已空 → 占位文本(模型再 read_artifact 即可重看)。
+        # 字节绝不进事件表(撑爆 + 与「blob 有专属持久家」冲突)。
+        tc_metadata = tool_result.metadata or None
+        _img = tc_metadata.get("image") if tc_metadata else None
+        if isinstance(_img, dict) and "data_uri" in _img:
+            state.setdefault("vision_blocks", {})[
+                (_img.get("artifact_id"), _img.get("version"))
+            ] = _img["data_uri"]
+            tc_metadata = {
+                **tc_metadata,
+                "image": {k: v for k, v in _img.items() if k != "data_uri"},
+            }
+
+        # skill 激活(决策 11/原则 8):read_skill 声明式回填 metadata.activated_skill →
+        # append 进 active_skills(能力轴持久化,回合末写 metadata、下回合捞回)+ 在**所有**
+        # agent 已算好的 EffectiveToolset 上 merge 该 skill 的预烤 skill_grants(全 agent 可见、
+        # 各自宇宙收窄)。纯字典操作、本回合即生效,不回 snapshot、不持闭包。仅成功调用、
+        # 仅新激活时动手(幂等)。
+        _activated = (tool_result.metadata or {}).get("activated_skill") if tool_result.success else None
+        if _activated:
+            active_list = state.setdefault("active_skills", [])
+            if _activated not in active_list:
+                active_list.append(_activated)
+                _granted: set = set()
+                for ets in effective_toolsets.values():
+                    _granted.update(ets.skill_grants.get(_activated, {}).keys())
+                    ets.activate_skill(_activated)
+                # obs:能力变更审计(info)—— skill 激活把 agent-disabled 工具翻开。仅本轮
+                # 新激活打一次(sticky 重放不到这条路径);无授予=其 allowed-tools 本就可调。
+                logger.info(
+                    "Skill %r activated via read_skill (message %s); enabled tools: %s",
+                    _activated, message_id, sorted(_granted) or "(none)",
+                )
+
+        await _emit(StreamEventType.TOOL_COMPLETE.value, agent_name, {
+            "tool": tool_name,
+            "success": tool_result.success,
+            "result_data": tool_result.data if tool_result.success else None,
+            "error": tool_result.error if not tool_result.success else None,
+            "duration_ms": tool_duration_ms,
+            "params": params,
+            "metadata": tc_metadata,
+            "parser_warnings": tool_call.warnings or None,
+        })
+
+        tool_round_count[agent_name] = tool_round_count.get(agent_name, 0) + 1
+
+    def _concurrent_batch(tool_calls: list, start: int, agent_name: str) -> List[Tuple[Any, BaseTool]]:
+        """从 start 起收集一段可并发的连续 tool_call：工具声明 concurrency_safe、
+        可直接执行(无解析错误 / 在可调集 / 存在 / 非 call_subagent)且**无需审批**
+        (AUTO 或已 always_allow)。需要审批的调用永远单独串行执行 —— 权限中断只能
+        落在工具之间。"""
+        batch: List[Tuple[Any, BaseTool]] = []
+        allowed = state.get("always_allowed_tools", [])
+        for tool_call in tool_calls[start:]:
+            name = tool_call.name
+            if tool_call.error or name == "call_subagent" or name not in effective_toolsets[agent_name]:
+                break
+            tool = _resolve_tool(name)
+            if tool is None or not getattr(tool, "concurrency_safe", False):
+                break
+            permission = effective_toolsets[agent_name].level(name) or tool.permission
+            if permission == ToolPermission.CONFIRM and name not in allowed:
+                break
+            batch.append((tool_call, tool))
+        return batch
+
+    async def _execute_concurrent(batch: List[Tuple[Any, BaseTool]], agent_name: str) -> None:
+        """并发执行一段 concurrency_safe 工具。
+
+        事件顺序：先按调用顺序发全部 TOOL_START，全部完成后再按调用顺序发
+        TOOL_COMPLETE —— 消费方（前端按工具名 FIFO 配对 running 调用、EventHistory
+        按 TOOL_COMPLETE 顺序还原 tool_result）看到的配对与顺序都与串行一致。
+        cancel 由一个 run_cancellable 统一轮询（不是每个工具各挂一个探针），命中即
+        整段取消、每个调用各得一条被打断的 TOOL_COMPLETE。
+        段内 cache key 相同的调用只执行一次（此时结果还没入缓存，逐个查缓存会全部
+        miss），重复调用复用首个调用的结果，仍各自成对发 START/COMPLETE。
+        """
+        for tool_call, _tool in batch:
+            await _emit(StreamEventType.TOOL_START.value, agent_name, {
+                "tool": tool_call.name, "params": tool_call.params, "reason": tool_call.reason,
+            })
+
+        async def _timed(tool_call, tool: BaseTool) -> Tuple[ToolResult, int]:
+            started = time.monotonic()
+            result = _cached_tool_result(tool, tool_call) or await _invoke_tool(tool, tool_call.params, agent_name)
+            return result, int((time.monotonic() - started) * 1000)
+
+        runs = []                   # 去重后实际执行的协程
+        slots: List[int] = []       # batch[i] → runs 下标
+        run_by_key: Dict[Tuple[str, bytes], int] = {}
+        for tool_call, tool in batch:
+            key = _tool_cache_key(tool, tool_call)
+            if key is not None and key in run_by_key:
+                slots.append(run_by_key[key])
+                continue
+            if key is not None:
+                run_by_key[key] = len(runs)
+            slots.append(len(runs))
+            runs.append(_timed(tool_call, tool))
+
+        batch_start_time = time.monotonic()
+        try:
+            outcomes = await run_cancellable(
+                asyncio.gather(*runs),
+                _is_cancelled, config.CANCEL_CHECK_INTERVAL,
+            )
+        except CooperativeCancelled:
+            logger.info(f"Concurrent tools {[tc.name for tc, _ in batch]} interrupted by user cancel mid-flight")
+            elapsed_ms = int((time.monotonic() - batch_start_time) * 1000)
+            outcomes = [(_cancelled_tool_result(), elapsed_ms) for _ in runs]
+
+        finished: set = set()
+        for (tool_call, tool), slot in zip(batch, slots):
+            tool_result, duration_ms = outcomes[slot]
+            if slot in finished:
+                # 重复调用：首个已走完落盘中间件并入缓存 → 取缓存里的落盘后结果，
+                # 避免同一超长结果被落盘两次（失败结果不入缓存，原样复用）
+                tool_result = _cached_tool_result(tool, tool_call) or tool_result
+            finished.add(slot)
+            await _finish_tool(tool_call, tool, tool_result, duration_ms, agent_name)
+
     async def _execute_tools(tool_calls: list, agent_name: str) -> None:
-        """串行执行工具列表，处理权限中断和 subagent 切换。
+        """按序执行工具列表，处理权限中断和 subagent 切换。
         call_subagent 延后到最后执行，确保同一轮的常规工具不会被 break 跳过。
+        连续的 concurrency_safe 且无需审批的调用成段并发（见 _concurrent_batch），
+        其余逐个串行。
         """
         tool_calls = sorted(tool_calls, key=lambda tc: tc.name == "call_subagent")
-        for tool_call in tool_calls:
+        i = 0
+        while i < len(tool_calls):
             if await _check_cancelled():
                 break
 
+            batch = _concurrent_batch(tool_calls, i, agent_name)
+            if len(batch) > 1:
+                await _execute_concurrent(batch, agent_name)
+                i += len(batch)
+                continue
+
+            tool_call = tool_calls[i]
+            i += 1
+
             # Parser 返回的解析错误 → 直接反馈给 agent
             # 配对发 TOOL_START + TOOL_COMPLETE，与 permission-denied / not-allowed
             # 路径保持一致；让消费者（live SSE / 历史重放）可以无条件假设 START 在
@@ -965,7 +1172,7 @@ async def execute_loop(
                         continue
 
             # 执行工具
-            tool_start_time = utc_now()
+            tool_start_time = time.monotonic()
             await _emit(StreamEventType.TOOL_START.value, agent_name, {
                 "tool": tool_name, "params": params, "reason": reason,
             })
@@ -977,95 +1184,15 @@ async def execute_loop(
             # 不变量保持，下一轮 history 里模型能看到"这次调用被用户打断"。
             # 随后的 _check_cancelled（下个工具前 / while 顶部）置终态 flag 收口。
             try:
-                # wants_context 工具(如 search_tools)在 execute 期需要引擎上下文(调用方
-                # agent 的可调视图 + 本 turn 工具注册表):调用时注入 ToolExecutionContext,
-                # 不存实例态(进程级实例并发 turn 共享,故 per-call 注入而非 per-instance)。
-                # context 只装非密事实(secret 走 B-4 credential resolver,不走这条)。
-                # 协程构造放 try 内:`tool(...)` 的**参数绑定**在 call 那一刻同步发生(协程
-                # 体尚未运行),任何绑定异常(如模型误吐 `_context` 与注入键撞车)需被这层
-                # per-tool except 接住、降级为单工具失败,而非漏到 turn 级掀翻整轮。
-                tool_coro = (
-                    tool(_context=ToolExecutionContext(
-                        agent_name=agent_name,
-                        effective_toolset=effective_toolsets[agent_name],
-                        tools=tools,
-                    ), **params)
-                    if getattr(tool, "wants_context", False)
-                    else tool(**params)
-                )
-                tool_result = await run_cancellable(
-                    tool_coro, _is_cancelled, config.CANCEL_CHECK_INTERVAL
+                tool_result = _cached_tool_result(tool, tool_call) or await run_cancellable(
+                    _invoke_tool(tool, params, agent_name), _is_cancelled, config.CANCEL_CHECK_INTERVAL
                 )
             except CooperativeCancelled:
                 logger.info(f"Tool '{tool_name}' interrupted by user cancel mid-flight")
-                tool_result = ToolResult(
-                    success=False,
-                    error=(
-                        "Cancelled by user while the tool was running. "
-                        "Side effects may or may not have been applied "
-                        "(the operation was already in flight)."
-                    ),
-                )
-            except Exception as e:
-                logger.exception(f"Tool '{tool_name}' execution error: {e}")
-                tool_result = ToolResult(success=False, error=str(e))
-
-            tool_end_time = utc_now()
-            tool_duration_ms = int((tool_end_time - tool_start_time).total_seconds() * 1000)
-
-            # 超长成功结果统一落盘为 artifact，回填预览（fail-open）
-            tool_result = await _maybe_persist_tool_result(tool_name, tool, tool_result)
-
-            # 识图:把图块 data-URI 从将入事件的 metadata 里摘出 → 存进本 turn 的
-            # state["vision_blocks"](仅内存、不持久化、跨轮自然失效);事件只留引用
-            # (artifact_id/version/content_type)。context build 据 state 还原:本轮命中
-            # → 注入图块;下一轮 state 已空 → 占位文本(模型再 read_artifact 即可重看)。
-            # 字节绝不进事件表(撑爆 + 与「blob 有专属持久家」冲突)。
-            tc_metadata = tool_result.metadata or None
-            _img = tc_metadata.get("image") if tc_metadata else None
-            if isinstance(_img, dict) and "data_uri" in _img:
-                state.setdefault("vision_blocks", {})[
-                    (_img.get("artifact_id"), _img.get("version"))
-                ] = _img["data_uri"]
-                tc_metadata = {
-                    **tc_metadata,
-                    "image": {k: v for k, v in _img.items() if k != "data_uri"},
-                }
-
-            # skill 激活(决策 11/原则 8):read_skill 声明式回填 metadata.activated_skill →
-            # append 进 active_skills(能力轴持久化,回合末写 metadata、下回合捞回)+ 在**所有**
-            # agent 已算好的 EffectiveToolset 上 merge 该 skill 的预烤 skill_grants(全 agent 可见、
-            # 各自宇宙收窄)。纯字典操作、本回合即生效,不回 snapshot、不持闭包。仅成功调用、
-            # 仅新激活时动手(幂等)。
-            _activated = (tool_result.metadata or {}).get("activated_skill") if tool_result.success else None
-            if _activated:
-                active_list = state.setdefault("active_skills", [])
-                if _activated not in active_list:
-                    active_list.append(_activated)
-                    _granted: set = set()
-                    for ets in effective_toolsets.values():
-                        _granted.update(ets.skill_grants.get(_activated, {}).keys())
-                        ets.activate_skill(_activated)
-                    # obs:能力变更审计(info)—— skill 激活把 agent-disabled 工具翻开。仅本轮
-                    # 新激活打一次(sticky 重放不到这条路径);无授予=其 allowed-tools 本就可调。
-                    logger.info(
-                        "Skill %r activated via read_skill (message %s); enabled tools: %s",
-                        _activated, message_id, sorted(_granted) or "(none)",
-                    )
-
-            await _emit(StreamEventType.TOOL_COMPLETE.value, agent_name, {
-                "tool": tool_name,
-                "success": tool_result.success,
-                "result_data": tool_result.data if tool_result.success else None,
-                "error": tool_result.error if not tool_result.success else None,
-                "duration_ms": tool_duration_ms,
-                "params": params,
-                "metadata": tc_metadata,
-                "parser_warnings": parser_warnings,
-            })
-
+                tool_result = _cancelled_tool_result()
 
-            tool_round_count[agent_name] = tool_round_count.get(agent_name, 0) + 1
+            tool_duration_ms = int((time.monotonic() - tool_start_time) * 1000)
+            await _finish_tool(tool_call, tool, tool_result, tool_duration_ms, agent_name)
 
     async def _check_cancelled() -> bool:
         # 同走软化谓词:探针异常在 loop 顶/工具间穿出会被 while 外层
@@ -1192,7 +1319,7 @@ async def execute_loop(
                 tool_round_count.pop(current_agent_name, None)
                 continue
 
-            # 串行执行工具
+            # 执行工具（按序；安全段并发）
             await _execute_tools(tool_calls, current_agent_name)
 
     except Exception as e:
@@ -74,9 +74,9 @@ TERMINAL_EVENT_TYPES = frozenset({
 # 内存事件（执行过程中累积，最终 batch write）
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionEvent:
-    """内存中的执行事件"""
+    """内存中的执行事件（slots：长对话每轮要从 DB 重载整条 path 的事件，省掉逐个 __dict__）"""
     event_type: str          # StreamEventType.value
     agent_name: Optional[str] = None
     data: Any = None
@@ -7,6 +7,7 @@
 
 import asyncio
 import os
+import random
 from pathlib import Path
 from typing import Optional, Dict, Any, AsyncIterator
 
@@ -47,6 +48,18 @@ _RETRYABLE_LLM_ERRORS = (
     InternalServerError,
 )
 
+# 限流/瞬态错误的单次退避封顶（秒）。
+_RETRY_BACKOFF_CAP = 30.0
+
+
+def _decorrelated_backoff(base: float, prev: float) -> float:
+    """去相关抖动退避：在 [base, 3×上次等待] 内随机取值并封顶。
+
+    并发 turn 同时撞上 429 / 5xx 时，固定指数退避会让它们在同一时刻集体重试、
+    再次撞墙（惊群）；随机化把重试打散开。
+    """
+    return min(_RETRY_BACKOFF_CAP, random.uniform(base, max(base, prev) * 3))
+
 
 # ========================================
 # 配置加载（模块级缓存）
@@ -150,6 +163,50 @@ def get_litellm_model_id(model_alias: str) -> str:
     return params["model"]
 
 
+# ========================================
+# 显式 prompt cache 断点
+# ========================================
+
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _with_cache_control(message: dict) -> dict:
+    """返回打上 cache_control 的消息副本:str content 转成单个 text 块,块列表则在
+    末块上标记(识图块列表同理)。不改原消息。"""
+    content = message.get("content")
+    if isinstance(content, str):
+        blocks = [{"type": "text", "text": content, "cache_control": _CACHE_CONTROL}]
+    else:
+        blocks = [*content[:-1], {**content[-1], "cache_control": _CACHE_CONTROL}]
+    return {**message, "content": blocks}
+
+
+def _apply_cache_breakpoints(messages: list[dict]) -> list[dict]:
+    """为需要显式标记的 provider(Anthropic/Bedrock、DashScope 显式缓存)打两个断点:
+
+    - system 消息:全 session 稳定前缀(role_prompt + agents + 语法)
+    - 倒数第二条消息:[system + 历史] 的末端。末条消息并着每轮现拼的
+      <system-reminder>,必然变化,不能当断点;断在它前面,下一轮就能命中到这里
+
+    断点数 ≤ 2(Anthropic 上限 4)。content 为空的消息不打(provider 拒空 text 块)。
+    """
+    marked = list(messages)
+    targets = {0} if marked and marked[0].get("role") == "system" else set()
+    if len(marked) >= 3:
+        targets.add(len(marked) - 2)
+    for i in targets:
+        if marked[i].get("content"):
+            marked[i] = _with_cache_control(marked[i])
+    return marked
+
+
+def model_prompt_caching(model: str) -> bool:
+    """该模型别名是否声明了显式 prompt cache(models.yaml `prompt_caching: true`)。
+    OpenAI / DeepSeek 等自动前缀缓存的 provider 不需要、也不应声明。未知/未声明 → False。"""
+    model_config = _load_config().get("models", {}).get(model) or {}
+    return bool(model_config.get("prompt_caching", False))
+
+
 # ========================================
 # 流式调用（带重试）
 # ========================================
@@ -185,37 +242,46 @@ async def astream_with_retry(
     params = _resolve_model_params(model, base_url, api_key)
     logger.info(f"LLM call: {params['model']}")
 
+    request_messages = _apply_cache_breakpoints(messages) if model_prompt_caching(model) else messages
+
     last_error = None
+    wait_time = retry_delay
 
     for attempt in range(max_retries):
         try:
-            response = await acompletion(messages=messages, **params)
+            response = await acompletion(messages=request_messages, **params)
 
             full_content = ""
             reasoning_content = ""
             token_usage = None
 
+            # 逐 token 热循环：每个属性只取一次进局部变量（getattr 带默认值代替
+            # hasattr + 再取一次的双查找）
             async for chunk in response:
                 # Token usage（通常在最后一个独立 chunk）
-                if hasattr(chunk, "usage") and chunk.usage:
+                usage = getattr(chunk, "usage", None)
+                if usage:
                     token_usage = {
-                        "prompt_tokens": getattr(chunk.usage, "prompt_tokens", 0),
-                        "completion_tokens": getattr(chunk.usage, "completion_tokens", 0),
-                        "total_tokens": getattr(chunk.usage, "total_tokens", 0),
+                        "prompt_tokens": getattr(usage, "prompt_tokens", 0),
+                        "completion_tokens": getattr(usage, "completion_tokens", 0),
+                        "total_tokens": getattr(usage, "total_tokens", 0),
                     }
 
-                if not chunk.choices:
+                choices = chunk.choices
+                if not choices:
                     continue
 
-                delta = chunk.choices[0].delta
+                delta = choices[0].delta
 
-                if hasattr(delta, "reasoning_content") and delta.reasoning_content:
-                    reasoning_content += delta.reasoning_content
-                    yield {"type": "reasoning", "content": delta.reasoning_content}
+                reasoning_piece = getattr(delta, "reasoning_content", None)
+                if reasoning_piece:
+                    reasoning_content += reasoning_piece
+                    yield {"type": "reasoning", "content": reasoning_piece}
 
-                if delta.content:
-                    full_content += delta.content
-                    yield {"type": "content", "content": delta.content}
+                content_piece = delta.content
+                if content_piece:
+                    full_content += content_piece
+                    yield {"type": "content", "content": content_piece}
 
             # Ensure token_usage is always populated — estimate if provider didn't return it
             if not token_usage or token_usage.get("prompt_tokens", 0) == 0:
@@ -247,16 +313,16 @@ async def astream_with_retry(
         except _RETRYABLE_LLM_ERRORS as e:
             last_error = e
             if isinstance(e, RateLimitError):
-                wait_time = retry_delay * (2 ** attempt)
-                logger.warning(f"LLM rate limited, retry {attempt+1}/{max_retries} after {wait_time}s")
+                wait_time = _decorrelated_backoff(retry_delay, wait_time)
+                logger.warning(f"LLM rate limited, retry {attempt+1}/{max_retries} after {wait_time:.2f}s")
             elif isinstance(e, Timeout):
                 wait_time = retry_delay
                 logger.warning(f"LLM timeout, retry {attempt+1}/{max_retries} after {wait_time}s")
             else:
-                wait_time = retry_delay * (1.5 ** attempt)
+                wait_time = _decorrelated_backoff(retry_delay, wait_time)
                 logger.warning(
                     f"LLM transient error ({type(e).__name__}): {e}, "
-                    f"retry {attempt+1}/{max_retries} after {wait_time}s"
+                    f"retry {attempt+1}/{max_retries} after {wait_time:.2f}s"
                 )
 
             if attempt < max_retries - 1:
@@ -322,8 +388,8 @@ def format_messages_for_debug(messages: list, max_content_len: int = 100000) ->
             lines.append(f"> {role} ({original_len} chars, truncated to {max_content_len}):")
         else:
             lines.append(f"> {role}:")
-        for line in content.split('\n'):
-            lines.append(f"  {line}")
+        # 整段缩进一次 replace 完成（等价于逐行加前缀，不为每行建一个字符串）
+        lines.append("  " + content.replace("\n", "\n  "))
         lines.append("")
     return "\n".join(lines)
 
@@ -102,6 +102,16 @@ class BaseTool(ABC):
     # 让它走正常工具路由(validate/事件/取消/落盘安全网)而非引擎特殊分支。默认 False。
     wants_context: bool = False
 
+    # opt-in:True → 同一轮里相邻的本工具调用(且无需审批)可被引擎并发执行(见 engine
+    # _concurrent_batch)。只给「无共享可变状态、互相独立」的 I/O 型工具打开(web_search /
+    # web_fetch);artifact/沙盒工具共享 WorkingSet / AsyncSession / 沙盒进程,必须串行。默认 False。
+    concurrency_safe: bool = False
+
+    # opt-in:True → 同一 turn 内参数完全相同的重复调用直接复用首次的成功结果(引擎 turn 级
+    # LRU,见 engine _cached_tool_result)。只给「同参同果、无副作用」的只读工具打开;
+    # artifact 读写结果随 turn 内写入变化,不能缓存。默认 False。
+    cacheable: bool = False
+
     def __init__(
         self,
         name: str,
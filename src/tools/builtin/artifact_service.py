@@ -106,6 +106,10 @@ class ArtifactService:
         # 收到无 base 可应用的 delta,从而无需中途查 DB 取 base(守原则 1:中途不查 DB
         # 求 live 态)。bind_emit(真回调)时按 turn 重置。
         self._emitted_base: set = set()
+        # list_artifacts 的 DB 侧快照(仅 turn 期间,即 bind_emit 绑定后):执行期写入只进
+        # WorkingSet、flush_all 才落库,故 turn 内 DB 行不变 —— 每轮 context 装配不必重查
+        # 整表(含全文)。WorkingSet 叠加每次现算。bind/unbind 与 flush_all 时作废。
+        self._db_listing: Dict[Tuple[str, Optional[str], bool], List[Tuple[str, Dict[str, Any]]]] = {}
 
     # ========================================
     # 接线 / 状态委托
@@ -115,6 +119,7 @@ class ArtifactService:
         """引擎在 execute_loop 起点注入 ``_emit`` 闭包,loop 末传 None 解绑,
         防止跨 turn 持有失效闭包。REST 永不调用此方法。"""
         self._emit = emit
+        self._db_listing.clear()
         if emit is not None:
             self._emitted_base = set()  # 每 turn 重置 base 跟踪
 
@@ -760,6 +765,7 @@ class ArtifactService:
         db_manager 提供时,每个 artifact flush 使用 fresh session + retry(对 DB 瞬时
         失败有韧性)。只清除 flush 成功的条目。任一失败则 raise,由调用方决定终态。
         """
+        self._db_listing.clear()  # 落库即改 DB 侧,快照作废
         if not self._ws.has_dirty():
             return
 
@@ -842,53 +848,64 @@ class ArtifactService:
         同轮改动。REST 侧 WorkingSet 恒空,故等价纯 DB 列表。
 
         DB 读 + 序列化全在短 session 回调内完成(B-5):`art.*` 在 session 内即 序列化成
-        纯 dict,ORM 行不出回调;WorkingSet 合并是内存操作,放回调内一并完成无妨。
+        纯 dict,ORM 行不出回调。turn 期间 DB 侧序列化结果按 (session, content_type,
+        include_content) 缓存(见 __init__ 的 _db_listing),WorkingSet 叠加每次现算。
         """
-        async def _build(repo) -> List[Dict[str, Any]]:
+        async def _load(repo) -> List[Tuple[str, Dict[str, Any]]]:
             db_artifacts = await repo.list_artifacts(
                 session_id=session_id,
                 content_type=content_type,
             )
-
-            seen_ids: set = set()
-            result: List[Dict[str, Any]] = []
+            rows = []
             for art in db_artifacts:
-                memory = self._ws.peek(session_id, art.id)
-                if memory and self._ws.is_dirty(session_id, art.id):
-                    if content_type and memory.content_type != content_type:
-                        continue
-                    info = self._serialize_memory(memory, include_content)
-                else:
-                    info = {
-                        "id": art.id,
-                        "content_type": art.content_type,
-                        "title": art.title,
-                        "version": art.current_version,
-                        "source": art.source,
-                        "original_filename": (art.metadata_ or {}).get("original_filename"),
-                        "has_blob": art.has_blob,
-                        "created_at": art.created_at.isoformat(),
-                        "updated_at": art.updated_at.isoformat(),
-                    }
-                    if include_content:
-                        info["content"] = art.content
-                result.append(info)
-                seen_ids.add(art.id)
-
-            # 追加 WorkingSet 里尚未落 DB 的 new artifact
-            for sid, aid in self._ws.new_keys(session_id):
-                if aid in seen_ids:
-                    continue
-                memory = self._ws.peek(sid, aid)
-                if not memory:
-                    continue
+                info = {
+                    "id": art.id,
+                    "content_type": art.content_type,
+                    "title": art.title,
+                    "version": art.current_version,
+                    "source": art.source,
+                    "original_filename": (art.metadata_ or {}).get("original_filename"),
+                    "has_blob": art.has_blob,
+                    "created_at": art.created_at.isoformat(),
+                    "updated_at": art.updated_at.isoformat(),
+                }
+                if include_content:
+                    info["content"] = art.content
+                rows.append((art.id, info))
+            return rows
+
+        cache_key = (session_id, content_type, include_content)
+        db_rows = self._db_listing.get(cache_key) if self._emit is not None else None
+        if db_rows is None:
+            db_rows = await self._run_with_repo(_load)
+            if self._emit is not None:
+                self._db_listing[cache_key] = db_rows
+
+        seen_ids: set = set()
+        result: List[Dict[str, Any]] = []
+        for aid, info in db_rows:
+            memory = self._ws.peek(session_id, aid)
+            if memory and self._ws.is_dirty(session_id, aid):
                 if content_type and memory.content_type != content_type:
                     continue
-                result.append(self._serialize_memory(memory, include_content))
+                info = self._serialize_memory(memory, include_content)
+            else:
+                info = dict(info)  # 浅拷贝:调用方拿到的 dict 不与快照共享
+            result.append(info)
+            seen_ids.add(aid)
 
-            return result
+        # 追加 WorkingSet 里尚未落 DB 的 new artifact
+        for sid, aid in self._ws.new_keys(session_id):
+            if aid in seen_ids:
+                continue
+            memory = self._ws.peek(sid, aid)
+            if not memory:
+                continue
+            if content_type and memory.content_type != content_type:
+                continue
+            result.append(self._serialize_memory(memory, include_content))
 
-        return await self._run_with_repo(_build)
+        return result
 
     @staticmethod
     def _serialize_memory(memory: ArtifactMemory, include_content: bool) -> Dict[str, Any]:
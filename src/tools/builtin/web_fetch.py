@@ -90,6 +90,11 @@ class WebFetchTool(BaseTool):
     - 智能降级：Jina失败后按类型降级（PDF → pypdf，HTML → BeautifulSoup）
     """
 
+    # 每次调用独立发 HTTP 请求、不碰共享状态：同轮多个调用可并发
+    concurrency_safe = True
+    # 只读、同参同果：同 turn 内重复调用复用首次结果
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             name="web_fetch",
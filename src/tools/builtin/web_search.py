@@ -31,6 +31,11 @@ class WebSearchTool(BaseTool):
     使用博查AI搜索引擎进行网页搜索
     """
     
+    # 每次调用独立发 HTTP 请求、不碰共享状态：同轮多个调用可并发
+    concurrency_safe = True
+    # 只读、同参同果：同 turn 内重复调用复用首次结果
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             name="web_search",
@@ -4,7 +4,8 @@ XML 格式化器
 与 xml_parser.py 互为 formatter / parser 对
 """
 
-from typing import List, Dict, Any
+import weakref
+from typing import List, Dict, Any, Tuple
 
 from config import config
 from tools.base import BaseTool
@@ -56,7 +57,23 @@ def render_tool_docs(tools: List[BaseTool]) -> str:
     供 `<available_tools>` 的 non-deferred 段与 `search_tools` 结果共用 —— 「完整描述
     长什么样」只此一处定义,两条披露路径不会漂移。
     """
-    return "\n".join(_format_tool_doc(tool) for tool in tools)
+    return "\n".join(_cached_tool_doc(tool) for tool in tools)
+
+
+# 工具 doc 只取决于构造期定下的 name/description/参数(+ 部署级 RENDER_TOOL_EXAMPLES),
+# 而 <available_tools> 每轮都要整段重渲:按工具实例缓存。registry 重载时建的是新实例 →
+# 自然失效;弱引用 → 被丢弃的旧实例不会被缓存钉住。
+_tool_doc_cache: "weakref.WeakKeyDictionary[BaseTool, Tuple[bool, str]]" = weakref.WeakKeyDictionary()
+
+
+def _cached_tool_doc(tool: BaseTool) -> str:
+    render_examples = config.RENDER_TOOL_EXAMPLES
+    cached = _tool_doc_cache.get(tool)
+    if cached is not None and cached[0] == render_examples:
+        return cached[1]
+    doc = _format_tool_doc(tool)
+    _tool_doc_cache[tool] = (render_examples, doc)
+    return doc
 
 
 def format_result(name: str, result: Dict[str, Any]) -> str:
@@ -70,21 +87,23 @@ def format_result(name: str, result: Dict[str, Any]) -> str:
     error = result.get("error", "")
     parser_warnings = result.get("parser_warnings") or []
 
-    xml = f'<tool_result name="{name}" success="{"true" if success else "false"}">'
+    # 分段收集、末尾一次 join：每轮 EventHistory 重建都会对历史里每个工具结果调用
+    # 一次，data 可达 max_result_size_chars，逐段 += 会把 data 反复整段拷贝
+    parts = [f'<tool_result name="{name}" success="{"true" if success else "false"}">']
 
     if parser_warnings:
         warnings_body = "\n".join(f"- {w}" for w in parser_warnings)
-        xml += f"\n<parser_warnings>\n{warnings_body}\n</parser_warnings>"
+        parts.append(f"\n<parser_warnings>\n{warnings_body}\n</parser_warnings>")
 
     if data:
-        xml += f"\n<data>\n{data}\n</data>"
+        parts += ("\n<data>\n", data, "\n</data>")
 
     if error:
-        xml += f"\n  <error>{error}</error>"
+        parts.append(f"\n  <error>{error}</error>")
 
-    xml += "\n</tool_result>"
+    parts.append("\n</tool_result>")
 
-    return xml
+    return "".join(parts)
 
 
 def _format_tool_doc(tool: BaseTool) -> str:
@@ -13,8 +13,9 @@ session timezone 与 UTC 的差)。
 仅以下场景保留 datetime.now()(本地)语义:
 - 展示给 LLM 的"当前时间"提示词(context_manager.py:69)— LLM 看到
   user-local 时间才符合 UX 预期
-- 纯 wall-clock duration 测量 — 理论上应改 time.monotonic(),但与本
-  PR 时区话题无关,留给后续
+
+duration 测量(事件里的 duration_ms)不走 datetime:engine / compaction 用
+time.monotonic() 相减 —— 不受 NTP 校时回拨影响,也不为每次计时构造 datetime。
 """
 
 from datetime import datetime, timezone
@@ -0,0 +1,106 @@
+"""
+Tests for cli/api_client.py — 字节级 SSE 解帧器与惰性解码的 SSEEvent
+"""
+
+import pytest
+
+import cli.api_client as api_client
+from cli.api_client import SSEEvent, _iter_sse_events
+
+
+class _FakeResponse:
+    """只实现 aiter_bytes 的假响应：按给定分块逐块吐出"""
+
+    def __init__(self, chunks: list[bytes]):
+        self._chunks = chunks
+
+    async def aiter_bytes(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+async def _collect(chunks: list[bytes]) -> list[tuple[str | None, bytes]]:
+    return [(name, bytes(payload)) async for name, payload in _iter_sse_events(_FakeResponse(chunks))]
+
+
+# ============================================================
+# _iter_sse_events
+# ============================================================
+
+class TestIterSSEEvents:
+    async def test_single_event(self):
+        events = await _collect([b'event: llm_chunk\ndata: {"a":1}\n\n'])
+        assert events == [("llm_chunk", b' {"a":1}')]
+
+    async def test_crlf_split_across_chunks(self):
+        # \r 与 \n 落在不同网络块里，行尾仍整体剥掉
+        events = await _collect([b"event: x\r", b"\ndata: 1\r", b"\n\r", b"\n"])
+        assert events == [("x", b" 1")]
+
+    async def test_line_split_across_chunks(self):
+        events = await _collect([b"da", b"ta: hel", b"lo\n", b"\n"])
+        assert events == [(None, b" hello")]
+
+    async def test_multiline_data_joined_with_newline(self):
+        events = await _collect([b"data: a\ndata: b\ndata: c\n\n"])
+        assert events == [(None, b" a\n b\n c")]
+
+    async def test_event_name_resets_after_dispatch(self):
+        events = await _collect([b"event: first\ndata: 1\n\ndata: 2\n\n"])
+        assert events == [("first", b" 1"), (None, b" 2")]
+
+    async def test_event_name_without_data_is_dropped_and_reset(self):
+        # 只有 event: 没有 data 的块按规范丢弃，名字也不会串到下一个事件
+        events = await _collect([b"event: orphan\n\ndata: 2\n\n"])
+        assert events == [(None, b" 2")]
+
+    async def test_comment_lines_ignored(self):
+        events = await _collect([b": ping\n\n: keepalive\nevent: x\ndata: 1\n\n"])
+        assert events == [("x", b" 1")]
+
+    async def test_id_and_retry_fields_ignored(self):
+        events = await _collect([b"id: 7\nretry: 1000\nevent: x\ndata: 1\n\n"])
+        assert events == [("x", b" 1")]
+
+    async def test_unterminated_final_event_not_dispatched(self):
+        events = await _collect([b"event: x\ndata: 1\n\nevent: y\ndata: 2\n"])
+        assert events == [("x", b" 1")]
+
+    async def test_oversized_event_raises(self, monkeypatch):
+        monkeypatch.setattr(api_client, "SSE_MAX_EVENT_BYTES", 16)
+        with pytest.raises(ValueError, match="SSE event exceeds"):
+            await _collect([b"data: 0123456789\n", b"data: 0123456789\n\n"])
+
+    async def test_oversized_unterminated_line_raises(self, monkeypatch):
+        monkeypatch.setattr(api_client, "SSE_MAX_EVENT_BYTES", 16)
+        with pytest.raises(ValueError, match="SSE line exceeds"):
+            await _collect([b"data: " + b"x" * 32])
+
+
+# ============================================================
+# SSEEvent
+# ============================================================
+
+class TestSSEEvent:
+    def test_payload_decoded_lazily(self):
+        event = SSEEvent.from_payload("llm_chunk", b'{"data": {"content": "hi"}, "agent": "lead"}')
+        assert event._envelope is None  # 构造时不解码
+        assert event.data == {"content": "hi"}
+        assert event.agent == "lead"
+        assert event._payload is None  # 解码后释放原始负载
+
+    def test_memoryview_payload(self):
+        event = SSEEvent.from_payload("x", memoryview(b' {"data": {"k": 1}}'))
+        assert event.data == {"k": 1}
+        assert event.agent is None
+
+    def test_corrupt_payload_treated_as_empty(self):
+        event = SSEEvent.from_payload("llm_chunk", b"{not json")
+        assert event.data == {}
+        assert event.agent is None
+
+    def test_direct_construction(self):
+        event = SSEEvent("complete", {"success": True}, agent="lead")
+        assert event.data == {"success": True}
+        assert event.agent == "lead"
+        assert SSEEvent("complete").data == {}
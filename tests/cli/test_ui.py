@@ -0,0 +1,144 @@
+"""
+Tests for cli/ui.py — StreamDisplay 的段落冻结（_flush_stable_content）与
+渲染线程的 llm_chunk 合并（_coalesce）
+"""
+
+import pytest
+from rich.markdown import Markdown
+from rich.rule import Rule
+from rich.text import Text
+
+import cli.ui as ui
+from cli.api_client import SSEEvent
+from cli.ui import StreamDisplay
+
+
+class _RecordingConsole:
+    """替身 console：把打印的 renderable 还原成 (kind, 文本) 记录下来"""
+
+    def __init__(self):
+        self.printed: list[tuple[str, str]] = []
+
+    def print(self, renderable, *args, **kwargs):
+        if isinstance(renderable, Rule):
+            self.printed.append(("rule", str(renderable.title)))
+        elif isinstance(renderable, Markdown):
+            self.printed.append(("block", renderable.markup))
+        elif isinstance(renderable, Text):
+            self.printed.append(("block", renderable.plain))
+        else:
+            self.printed.append(("other", str(renderable)))
+
+    def blocks(self) -> list[str]:
+        return [text for kind, text in self.printed if kind == "block"]
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    rec = _RecordingConsole()
+    monkeypatch.setattr(ui, "console", rec)
+    return rec
+
+
+def _stream(display: StreamDisplay, *snapshots: str):
+    """未 start() 的 StreamDisplay 同步应用事件；snapshots 为累积内容"""
+    display.handle_event(SSEEvent("agent_start", {}, agent="lead_agent"))
+    for content in snapshots:
+        display.handle_event(SSEEvent("llm_chunk", {"content": content}, agent="lead_agent"))
+
+
+def _tail(display: StreamDisplay) -> str:
+    return display.current_content[display._content_flushed:]
+
+
+# ============================================================
+# _flush_stable_content
+# ============================================================
+
+class TestFlushStableContent:
+    def test_no_boundary_keeps_everything_in_tail(self, recorder):
+        display = StreamDisplay()
+        _stream(display, "just one paragraph")
+        assert recorder.printed == []
+        assert _tail(display) == "just one paragraph"
+
+    def test_cumulative_chunks_freeze_paragraphs_in_order(self, recorder):
+        display = StreamDisplay()
+        _stream(display, "one", "one\n\ntwo", "one\n\ntwo\n\nthr", "one\n\ntwo\n\nthree")
+
+        # 首次冻结先打一条带 agent 名的标题线，且只打一次
+        assert [k for k, _ in recorder.printed].count("rule") == 1
+        assert recorder.printed[0] == ("rule", "[cyan]lead_agent[/cyan]")
+        assert recorder.blocks() == ["one", "two"]
+        assert _tail(display) == "three"
+
+    def test_paragraph_break_split_across_chunks(self, recorder):
+        # "\n\n" 的两个换行落在两个 chunk 里：增量扫描回退 1 字符仍能命中
+        display = StreamDisplay()
+        _stream(display, "para one\n", "para one\n\npara two")
+        assert recorder.blocks() == ["para one"]
+        assert _tail(display) == "para two"
+
+    def test_blank_lines_inside_open_fence_not_split(self, recorder):
+        display = StreamDisplay()
+        fenced = "intro\n\n```\na\n\nb"
+        _stream(display, fenced)
+        # fence 未闭合：其内部的空行不是切点，只冻结 fence 之前的段落
+        assert recorder.blocks() == ["intro"]
+        assert _tail(display) == "```\na\n\nb"
+
+        display.handle_event(SSEEvent(
+            "llm_chunk", {"content": fenced + "\n```\n\nafter"}, agent="lead_agent",
+        ))
+        # fence 闭合后整块一次冻结
+        assert recorder.blocks() == ["intro", "```\na\n\nb\n```"]
+        assert _tail(display) == "after"
+
+    def test_complete_fence_in_single_snapshot(self, recorder):
+        display = StreamDisplay()
+        _stream(display, "```py\nx = 1\n\ny = 2\n```\n\ntail")
+        assert recorder.blocks() == ["```py\nx = 1\n\ny = 2\n```"]
+        assert _tail(display) == "tail"
+
+    def test_agent_complete_prints_remaining_tail(self, recorder):
+        display = StreamDisplay()
+        _stream(display, "one\n\ntwo")
+        display.handle_event(SSEEvent("agent_complete", {}, agent="lead_agent"))
+        assert recorder.blocks() == ["one", "two"]
+        assert display.current_content == ""
+        assert display._content_flushed == 0
+
+
+# ============================================================
+# _coalesce
+# ============================================================
+
+def _chunk(agent: str, **data) -> SSEEvent:
+    return SSEEvent("llm_chunk", data, agent=agent)
+
+
+class TestCoalesce:
+    def test_single_event_untouched(self):
+        batch = [_chunk("a", content="x")]
+        assert StreamDisplay._coalesce(batch) == batch
+
+    def test_keeps_last_of_consecutive_chunks_per_agent_and_field(self):
+        c1, c2 = _chunk("a", content="1"), _chunk("a", content="12")
+        r1 = _chunk("a", reasoning_content="r")
+        c3 = _chunk("a", content="123")
+        b1, b2 = _chunk("b", content="x"), _chunk("b", content="xy")
+
+        kept = StreamDisplay._coalesce([c1, c2, r1, c3, b1, b2])
+
+        # 字段 / agent 切换都断开合并，保持相对顺序
+        assert kept == [c2, r1, c3, b2]
+
+    def test_non_chunk_events_kept_in_order_and_break_runs(self):
+        c1, c2 = _chunk("a", content="1"), _chunk("a", content="12")
+        tool_start = SSEEvent("tool_start", {"tool": "t"}, agent="a")
+        c3, c4 = _chunk("a", content="123"), _chunk("a", content="1234")
+        done = SSEEvent("agent_complete", {}, agent="a")
+
+        kept = StreamDisplay._coalesce([c1, c2, tool_start, c3, c4, done])
+
+        assert kept == [c2, tool_start, c4, done]
@@ -529,6 +529,286 @@ class TestToolExecution:
         assert start_idx < complete_idx
 
 
+# ============================================================
+# TestConcurrentTools
+# ============================================================
+
+
+class _ConcurrentTool(BaseTool):
+    """concurrency_safe fake: execute 期间登记在飞数，用来观测是否真的重叠。"""
+
+    concurrency_safe = True
+
+    def __init__(self, name: str, tracker: dict, permission: ToolPermission = ToolPermission.AUTO):
+        super().__init__(name=name, description=f"Concurrent {name}", permission=permission)
+        self._tracker = tracker
+
+    def get_parameters(self):
+        return []
+
+    async def execute(self, **params) -> ToolResult:
+        self._tracker.setdefault("started", []).append(self.name)
+        self._tracker["in_flight"] += 1
+        self._tracker["peak"] = max(self._tracker["peak"], self._tracker["in_flight"])
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            self._tracker["in_flight"] -= 1
+        return ToolResult(success=True, data=f"{self.name}:{params.get('q')}")
+
+    async def __call__(self, **params) -> ToolResult:
+        return await self.execute(**params)
+
+
+class TestConcurrentTools:
+
+    async def test_adjacent_safe_tools_overlap_and_emit_in_call_order(self):
+        tracker = {"in_flight": 0, "peak": 0}
+        agent = _FakeAgentConfig(tools={"fetch_a": "auto", "fetch_b": "auto"})
+        tools = {
+            "fetch_a": _ConcurrentTool("fetch_a", tracker),
+            "fetch_b": _ConcurrentTool("fetch_b", tracker),
+        }
+        xml = _tool_call_xml("fetch_a", q="1") + "\n" + _tool_call_xml("fetch_b", q="2")
+        rounds = [_tool_call_chunks(xml), _simple_llm_chunks("done")]
+
+        result, emitted, store = await _run_engine(
+            _make_fake_stream_sequence(rounds),
+            agents={"lead_agent": agent},
+            tools=tools,
+        )
+
+        assert result["completed"] is True
+        assert tracker["peak"] == 2
+
+        tool_events = [
+            (e["type"], e["data"]["tool"]) for e in emitted
+            if e["type"] in ("tool_start", "tool_complete")
+        ]
+        assert tool_events == [
+            ("tool_start", "fetch_a"), ("tool_start", "fetch_b"),
+            ("tool_complete", "fetch_a"), ("tool_complete", "fetch_b"),
+        ]
+        completes = _events_of_type(emitted, "tool_complete")
+        assert [c["data"]["result_data"] for c in completes] == ["fetch_a:1", "fetch_b:2"]
+
+    async def test_unsafe_tool_breaks_batch(self):
+        # 非 concurrency_safe 工具夹在中间 → 两侧各自只剩一个调用，全程串行
+        tracker = {"in_flight": 0, "peak": 0}
+        agent = _FakeAgentConfig(tools={"fetch_a": "auto", "plain": "auto", "fetch_b": "auto"})
+        tools = {
+            "fetch_a": _ConcurrentTool("fetch_a", tracker),
+            "plain": _FakeTool("plain"),
+            "fetch_b": _ConcurrentTool("fetch_b", tracker),
+        }
+        xml = "\n".join(_tool_call_xml(n) for n in ("fetch_a", "plain", "fetch_b"))
+        rounds = [_tool_call_chunks(xml), _simple_llm_chunks("done")]
+
+        result, emitted, store = await _run_engine(
+            _make_fake_stream_sequence(rounds),
+            agents={"lead_agent": agent},
+            tools=tools,
+        )
+
+        assert tracker["peak"] == 1
+        tool_events = [e["type"] for e in emitted if e["type"] in ("tool_start", "tool_complete")]
+        assert tool_events == ["tool_start", "tool_complete"] * 3
+
+    async def test_confirm_tool_not_batched(self):
+        # 需要审批的调用单独走权限中断路径、批准后执行，不与后面的安全调用并发
+        tracker = {"in_flight": 0, "peak": 0}
+        agent = _FakeAgentConfig(tools={"fetch_a": "confirm", "fetch_b": "auto"})
+        tools = {
+            "fetch_a": _ConcurrentTool("fetch_a", tracker, permission=ToolPermission.CONFIRM),
+            "fetch_b": _ConcurrentTool("fetch_b", tracker),
+        }
+        xml = _tool_call_xml("fetch_a") + "\n" + _tool_call_xml("fetch_b")
+        rounds = [_tool_call_chunks(xml), _simple_llm_chunks("done")]
+
+        store = InMemoryRuntimeStore()
+        state = create_initial_state(task="test", session_id="s1", message_id="msg-1", path_events=[])
+        emitted = []
+
+        async def _approve():
+            for _ in range(100):
+                if await store.get_interrupt_data("msg-1") is not None:
+                    await store.resolve_interrupt("msg-1", {"approved": True})
+                    return
+                await asyncio.sleep(0.01)
+
+        async def capture_emit(event_dict):
+            emitted.append(event_dict)
+            if event_dict["type"] == "permission_request":
+                asyncio.create_task(_approve())
+
+        with patch("models.llm.astream_with_retry", _make_fake_stream_sequence(rounds)), \
+             patch("core.engine.config.PERMISSION_TIMEOUT", 5):
+            await execute_loop(
+                state=state,
+                agents={"lead_agent": agent},
+                tools=tools,
+                effective_toolsets=effective_for({"lead_agent": agent}, tools),
+                hooks=_hooks_from_store(store),
+                emit=capture_emit,
+            )
+
+        assert tracker["started"] == ["fetch_a", "fetch_b"]
+        types_and_tools = [(e["type"], (e["data"] or {}).get("tool")) for e in emitted]
+        perm_idx = next(i for i, (t, _) in enumerate(types_and_tools) if t == "permission_request")
+        assert perm_idx < types_and_tools.index(("tool_start", "fetch_b"))
+        assert tracker["peak"] == 1
+
+    async def test_cancel_interrupts_whole_batch(self):
+        """批内工具在飞时命中 cancel → 整段 gather 被取消，每个 TOOL_START 各配一条
+        被打断的 TOOL_COMPLETE，按调用顺序。"""
+        store = InMemoryRuntimeStore()
+        message_id = "msg-cancel-batch"
+        cancelled = []
+
+        class _HangingConcurrentTool(_ConcurrentTool):
+            async def execute(self, **params) -> ToolResult:
+                await store.request_cancel(message_id)
+                try:
+                    await asyncio.sleep(30)
+                except asyncio.CancelledError:
+                    cancelled.append(self.name)
+                    raise
+                return ToolResult(success=True, data="never")
+
+        tracker = {"in_flight": 0, "peak": 0}
+        agent = _FakeAgentConfig(tools={"fetch_a": "auto", "fetch_b": "auto"})
+        tools = {
+            "fetch_a": _HangingConcurrentTool("fetch_a", tracker),
+            "fetch_b": _HangingConcurrentTool("fetch_b", tracker),
+        }
+        xml = _tool_call_xml("fetch_a") + "\n" + _tool_call_xml("fetch_b")
+
+        result, emitted, _store = await _run_engine(
+            _make_fake_stream(_tool_call_chunks(xml)),
+            agents={"lead_agent": agent},
+            tools=tools,
+            message_id=message_id,
+            store=store,
+            cancel_check_interval=0.01,
+        )
+
+        assert result["cancelled"] is True
+        assert sorted(cancelled) == ["fetch_a", "fetch_b"]
+        tool_events = [
+            (e["type"], e["data"]["tool"]) for e in emitted
+            if e["type"] in ("tool_start", "tool_complete")
+        ]
+        assert tool_events == [
+            ("tool_start", "fetch_a"), ("tool_start", "fetch_b"),
+            ("tool_complete", "fetch_a"), ("tool_complete", "fetch_b"),
+        ]
+        for c in _events_of_type(emitted, "tool_complete"):
+            assert c["data"]["success"] is False
+            assert "Cancelled by user" in c["data"]["error"]
+
+
+# ============================================================
+# TestToolResultCache
+# ============================================================
+
+
+class _CountingTool(_FakeTool):
+    """记录 execute 次数的 fake；cacheable 由实例属性覆盖类默认值。"""
+
+    def __init__(self, name: str, cacheable: bool):
+        super().__init__(name, ToolResult(success=True, data=f"{name} result"))
+        self.cacheable = cacheable
+        self.calls = 0
+
+    async def execute(self, **params) -> ToolResult:
+        self.calls += 1
+        return self._result
+
+
+class TestToolResultCache:
+
+    async def _run_repeat(self, tool: _CountingTool, first: dict, second: dict):
+        agent = _FakeAgentConfig(tools={tool.name: "auto"}, max_tool_rounds=5)
+        rounds = [
+            _tool_call_chunks(_tool_call_xml(tool.name, **first)),
+            _tool_call_chunks(_tool_call_xml(tool.name, **second)),
+            _simple_llm_chunks("done"),
+        ]
+        return await _run_engine(
+            _make_fake_stream_sequence(rounds),
+            agents={"lead_agent": agent},
+            tools={tool.name: tool},
+        )
+
+    async def test_identical_call_in_later_round_reuses_result(self):
+        tool = _CountingTool("lookup", cacheable=True)
+        result, emitted, store = await self._run_repeat(tool, {"q": "x", "n": "1"}, {"n": "1", "q": "x"})
+
+        assert tool.calls == 1
+        completes = _events_of_type(emitted, "tool_complete")
+        assert len(completes) == 2  # 命中缓存仍照常配对发事件
+        assert all(c["data"]["result_data"] == "lookup result" for c in completes)
+
+    async def test_identical_calls_in_one_batch_run_once(self):
+        tool = _CountingTool("lookup", cacheable=True)
+        tool.concurrency_safe = True
+        agent = _FakeAgentConfig(tools={"lookup": "auto"})
+        xml = _tool_call_xml("lookup", q="x") + "\n" + _tool_call_xml("lookup", q="x")
+        rounds = [_tool_call_chunks(xml), _simple_llm_chunks("done")]
+
+        result, emitted, store = await _run_engine(
+            _make_fake_stream_sequence(rounds),
+            agents={"lead_agent": agent},
+            tools={"lookup": tool},
+        )
+
+        assert tool.calls == 1
+        assert len(_events_of_type(emitted, "tool_start")) == 2
+        completes = _events_of_type(emitted, "tool_complete")
+        assert [c["data"]["result_data"] for c in completes] == ["lookup result"] * 2
+
+    async def test_different_params_miss(self):
+        tool = _CountingTool("lookup", cacheable=True)
+        await self._run_repeat(tool, {"q": "x"}, {"q": "y"})
+        assert tool.calls == 2
+
+    @pytest.mark.parametrize("concurrency_safe", [False, True])
+    async def test_unencodable_params_treated_as_uncacheable(self, concurrency_safe):
+        # orjson 对超 64 位整数 / 非 str 键直接抛（不走 default）：cache key 退化为
+        # None，调用照常执行而不是掀翻整轮
+        tool = _CountingTool("lookup", cacheable=True)
+        tool.concurrency_safe = concurrency_safe
+        agent = _FakeAgentConfig(tools={"lookup": "auto"})
+        xml = _tool_call_xml("lookup", q="x") + "\n" + _tool_call_xml("lookup", q="x")
+        rounds = [_tool_call_chunks(xml), _simple_llm_chunks("done")]
+
+        from core import engine as engine_module
+        real_parse = engine_module.parse_tool_calls
+
+        def parse_with_wide_int(text):
+            calls = real_parse(text)
+            for tc in calls:
+                tc.params = {"n": 2 ** 70}
+            return calls
+
+        with patch("core.engine.parse_tool_calls", parse_with_wide_int):
+            result, emitted, store = await _run_engine(
+                _make_fake_stream_sequence(rounds),
+                agents={"lead_agent": agent},
+                tools={"lookup": tool},
+            )
+
+        assert result["completed"] is True
+        assert not result.get("error")
+        assert tool.calls == 2
+        assert len(_events_of_type(emitted, "tool_complete")) == 2
+
+    async def test_non_cacheable_tool_always_runs(self):
+        tool = _CountingTool("lookup", cacheable=False)
+        await self._run_repeat(tool, {"q": "x"}, {"q": "x"})
+        assert tool.calls == 2
+
+
 # ============================================================
 # TestPermissionInterrupt
 # ============================================================
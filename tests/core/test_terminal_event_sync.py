@@ -44,3 +44,11 @@ def test_stream_router_terminal_set_in_sync():
         "stream router._TERMINAL_EVENTS 与权威集合漂移 —— "
         "SSE 不会在缺失的终态上关闭连接 (P1#2)"
     )
+
+
+def test_cli_client_terminal_set_in_sync():
+    from cli.api_client import _TERMINAL_EVENTS
+    assert set(_TERMINAL_EVENTS) == TERMINAL_EVENT_TYPES, (
+        "cli api_client._TERMINAL_EVENTS 与权威集合漂移 —— "
+        "CLI 不会在缺失的终态上停止消费 SSE (P1#2)"
+    )
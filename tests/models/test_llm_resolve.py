@@ -125,3 +125,124 @@ async def test_rate_limit_is_retried(monkeypatch):
         await _drain(astream_with_retry([{"role": "user", "content": "x"}],
                                         model="gpt-4o-mini", max_retries=3, retry_delay=0))
     assert calls["n"] == 3  # 重试满 3 次才抛
+
+
+async def test_rate_limit_backoff_is_jittered_and_capped(monkeypatch):
+    """限流退避走去相关抖动:每次等待落在 [retry_delay, min(cap, 3×上次)] 内。"""
+    from models import llm
+
+    async def fake_acompletion(**kwargs):
+        raise RateLimitError(message="slow down", llm_provider="p", model="m")
+
+    waits = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr("models.llm.acompletion", fake_acompletion)
+    monkeypatch.setattr("models.llm.asyncio.sleep", fake_sleep)
+    with pytest.raises(RateLimitError):
+        await _drain(astream_with_retry([{"role": "user", "content": "x"}],
+                                        model="gpt-4o-mini", max_retries=6, retry_delay=10.0))
+
+    assert len(waits) == 5  # 最后一次失败直接抛,不再 sleep
+    prev = 10.0
+    for w in waits:
+        assert 10.0 <= w <= min(llm._RETRY_BACKOFF_CAP, prev * 3)
+        prev = w
+
+
+async def test_stream_chunks_split_into_reasoning_content_and_usage(monkeypatch):
+    """逐 chunk 解析:delta 可能根本没有 reasoning_content 属性、chunk 可能没有 usage 属性
+    (provider 差异),都按「无此字段」处理;usage 来自末尾独立 chunk。"""
+    from types import SimpleNamespace as NS
+
+    def _chunk(delta, usage=None):
+        c = NS(choices=[NS(delta=delta)] if delta is not None else [])
+        if usage is not None:
+            c.usage = usage
+        return c
+
+    chunks = [
+        _chunk(NS(reasoning_content="think", content=None)),
+        _chunk(NS(content="Hel")),                    # 无 reasoning_content 属性
+        _chunk(NS(reasoning_content=None, content="lo")),
+        _chunk(None, usage=NS(prompt_tokens=3, completion_tokens=2, total_tokens=5)),
+    ]
+
+    async def fake_acompletion(**kwargs):
+        async def gen():
+            for c in chunks:
+                yield c
+        return gen()
+
+    monkeypatch.setattr("models.llm.acompletion", fake_acompletion)
+    out = await _drain(astream_with_retry([{"role": "user", "content": "x"}], model="gpt-4o-mini"))
+
+    assert [c for c in out if c["type"] in ("reasoning", "content")] == [
+        {"type": "reasoning", "content": "think"},
+        {"type": "content", "content": "Hel"},
+        {"type": "content", "content": "lo"},
+    ]
+    assert out[-1] == {
+        "type": "final",
+        "content": "Hello",
+        "reasoning_content": "think",
+        "token_usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+    }
+
+
+# ============================================================
+# 显式 prompt cache 断点(models.yaml prompt_caching)
+# ============================================================
+
+from models.llm import _apply_cache_breakpoints
+
+
+def test_cache_breakpoints_on_system_and_history_tail():
+    messages = [
+        {"role": "system", "content": "SYS"},
+        {"role": "user", "content": "q1"},
+        {"role": "assistant", "content": "a1"},
+        {"role": "user", "content": [
+            {"type": "text", "text": "result"},
+            {"type": "image_url", "image_url": {"url": "data:image/png;base64,AA"}},
+        ]},
+        {"role": "user", "content": "tail + <system-reminder>"},
+    ]
+    marked = _apply_cache_breakpoints(messages)
+
+    assert marked[0]["content"] == [
+        {"type": "text", "text": "SYS", "cache_control": {"type": "ephemeral"}},
+    ]
+    # 倒数第二条(块列表)只在末块打标;末条(每轮变化的 reminder)不打
+    assert marked[3]["content"][0] == {"type": "text", "text": "result"}
+    assert marked[3]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert marked[4] == messages[4]
+    assert marked[1] is messages[1] and marked[2] is messages[2]
+    # 不改原消息
+    assert messages[0]["content"] == "SYS"
+    assert "cache_control" not in messages[3]["content"][-1]
+
+
+async def test_prompt_caching_only_when_model_declares_it(monkeypatch):
+    sent = []
+
+    async def fake_acompletion(**kwargs):
+        sent.append(kwargs["messages"])
+
+        async def gen():
+            return
+            yield
+        return gen()
+
+    monkeypatch.setattr("models.llm.acompletion", fake_acompletion)
+    messages = [{"role": "system", "content": "SYS"}, {"role": "user", "content": "hi"}]
+
+    monkeypatch.setattr("models.llm.model_prompt_caching", lambda model: False)
+    await _drain(astream_with_retry(messages, model="gpt-4o-mini"))
+    monkeypatch.setattr("models.llm.model_prompt_caching", lambda model: True)
+    await _drain(astream_with_retry(messages, model="gpt-4o-mini"))
+
+    assert sent[0] is messages
+    assert sent[1][0]["content"][0]["cache_control"] == {"type": "ephemeral"}
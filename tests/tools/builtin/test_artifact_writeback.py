@@ -697,6 +697,69 @@ class TestWriteBackInventory:
         assert artifacts[0]["version"] == 2
 
 
+    async def test_bound_turn_reuses_db_listing_until_flush(
+        self, artifact_service: ArtifactService, artifact_repo: ArtifactRepository,
+        session_id: str, monkeypatch
+    ):
+        """turn 期间(已 bind_emit)DB 侧清单只查一次:执行期写入只进 WorkingSet,
+        叠加照常生效;flush_all 落库后快照作废、下次重查。"""
+        await artifact_repo.create_artifact(
+            session_id=session_id,
+            artifact_id="report",
+            content_type="text/markdown",
+            title="Report",
+            content="old content",
+        )
+
+        queries = {"n": 0}
+        real_list = artifact_repo.list_artifacts
+
+        async def counting_list(*args, **kwargs):
+            queries["n"] += 1
+            return await real_list(*args, **kwargs)
+
+        monkeypatch.setattr(artifact_repo, "list_artifacts", counting_list)
+
+        async def _noop_emit(*args, **kwargs):
+            pass
+
+        artifact_service.bind_emit(_noop_emit)
+        artifact_service.set_session(session_id)
+
+        await artifact_service.list_artifacts(session_id)
+        ok, _, _ = await artifact_service.update_artifact(
+            session_id=session_id,
+            artifact_id="report",
+            old_str="old content",
+            new_str="new content",
+        )
+        assert ok
+        ok, _ = await artifact_service.create_artifact(
+            session_id=session_id,
+            artifact_id="notes",
+            content_type="text/plain",
+            title="Notes",
+            content="n",
+        )
+        assert ok
+
+        artifacts = await artifact_service.list_artifacts(session_id)
+        assert queries["n"] == 1
+        assert [(a["id"], a["version"]) for a in artifacts] == [("report", 2), ("notes", 1)]
+        assert artifacts[0]["content"] == "new content"
+
+        await artifact_service.flush_all(session_id)
+        artifacts = await artifact_service.list_artifacts(session_id)
+        assert queries["n"] == 2
+        assert {a["id"]: a["version"] for a in artifacts} == {"report": 2, "notes": 1}
+
+        # 未绑定(REST 路径)不缓存
+        artifact_service.bind_emit(None)
+        await artifact_service.list_artifacts(session_id)
+        await artifact_service.list_artifacts(session_id)
+        assert queries["n"] == 4
+
+
 class TestWriteBackFlushFailure:
     """Verify that failed flushes retain dirty state."""
 
@@ -154,3 +154,26 @@ def test_output_capped_when_too_many_match(monkeypatch):
     assert "common tool c" not in res.data and "common tool d" not in res.data
     assert "2 more tool(s) matched" in res.data
     assert "t__c" in res.data and "t__d" in res.data
+
+
+def test_tool_docs_cached_per_instance(monkeypatch):
+    """tool doc 按实例缓存:重复渲染不再调 get_parameters;RENDER_TOOL_EXAMPLES 切换即重渲。"""
+    from config import config
+    from tools.xml_formatter import render_tool_docs
+
+    calls = {"n": 0}
+
+    class _CountingTool(_Tool):
+        def get_parameters(self):
+            calls["n"] += 1
+            return super().get_parameters()
+
+    tool = _CountingTool("weather", "Query the weather")
+    monkeypatch.setattr(config, "RENDER_TOOL_EXAMPLES", True)
+    first = render_tool_docs([tool])
+    assert render_tool_docs([tool]) == first
+    assert calls["n"] == 1
+
+    monkeypatch.setattr(config, "RENDER_TOOL_EXAMPLES", False)
+    assert "Example:" not in render_tool_docs([tool])
+    assert calls["n"] == 2